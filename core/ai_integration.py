@@ -2,9 +2,10 @@
 AI Integration for Eir using Ollama.
 """
 
+import asyncio
 import json
 import requests
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple, Iterator, AsyncIterator
 from dataclasses import dataclass
 import logging
 
@@ -135,6 +136,107 @@ Always be ready to explain STPA concepts, guide methodology application, and hel
             logger.error(f"AI response generation failed: {e}")
             return self._get_fallback_response(user_input)
 
+    async def agenerate_response(self, user_input: str, context: Optional[Dict[str, Any]] = None) -> str:
+        """Generate AI response without blocking the calling event loop"""
+        # requests is blocking, so the call runs in the loop's default executor
+        return await asyncio.to_thread(self.generate_response, user_input, context)
+
+    def stream_response(self, user_input: str, context: Optional[Dict[str, Any]] = None) -> Iterator[str]:
+        """Generate AI response piece by piece as Ollama produces it"""
+        logger.debug(f"Streaming AI response for input: {user_input[:50]}...")
+        
+        messages = self._build_conversation_context(user_input, context)
+        parts: List[str] = []
+        
+        try:
+            with requests.post(
+                f"{self.config.base_url}/api/chat",
+                json=self._build_chat_payload(messages, stream=True),
+                timeout=self.config.timeout,
+                stream=True
+            ) as response:
+                if response.status_code != 200:
+                    logger.warning(f"Ollama API error: {response.status_code}")
+                else:
+                    # Ollama streams one JSON object per line
+                    for line in response.iter_lines():
+                        if not line:
+                            continue
+                        chunk = json.loads(line)
+                        content = chunk.get("message", {}).get("content", "")
+                        if content:
+                            parts.append(content)
+                            yield content
+                        if chunk.get("done"):
+                            break
+                            
+        except requests.exceptions.Timeout:
+            logger.warning("AI request timed out")
+        except requests.exceptions.ConnectionError:
+            logger.warning("Could not connect to Ollama")
+        except Exception as e:
+            logger.error(f"Ollama streaming call failed: {e}")
+        
+        response_text = "".join(parts).strip()
+        if response_text:
+            self.conversation_history.append({"role": "user", "content": user_input})
+            self.conversation_history.append({"role": "assistant", "content": response_text})
+            if len(self.conversation_history) > 20:  # Keep last 10 exchanges
+                self.conversation_history = self.conversation_history[-20:]
+        else:
+            logger.warning("AI response was empty, using fallback")
+            yield self._get_fallback_response(user_input)
+
+    async def astream_response(self, user_input: str, context: Optional[Dict[str, Any]] = None) -> AsyncIterator[str]:
+        """Stream AI response without blocking the calling event loop"""
+        chunks = self.stream_response(user_input, context)
+        while True:
+            # Each blocking read from the stream runs in the loop's default executor
+            chunk = await asyncio.to_thread(next, chunks, None)
+            if chunk is None:
+                break
+            yield chunk
+
+    def embed_batch(self, texts: List[str]) -> List[List[float]]:
+        """Embed several texts with a single call to Ollama's /api/embed endpoint"""
+        if not texts:
+            return []
+        
+        try:
+            response = requests.post(
+                f"{self.config.base_url}/api/embed",
+                json={"model": self.config.model, "input": texts},
+                timeout=self.config.timeout
+            )
+            
+            if response.status_code == 200:
+                embeddings = response.json().get("embeddings", [])
+                if len(embeddings) == len(texts):
+                    return embeddings
+                logger.warning(f"Ollama returned {len(embeddings)} embeddings for {len(texts)} texts")
+            else:
+                logger.warning(f"Ollama embed error: {response.status_code}")
+                
+        except requests.exceptions.ConnectionError:
+            logger.warning("Could not connect to Ollama")
+        except Exception as e:
+            logger.error(f"Ollama embed call failed: {e}")
+        return []
+
+    def embed_cached(self, texts: Dict[str, str],
+                     cache: Dict[Tuple[str, int], List[float]]) -> Dict[str, List[float]]:
+        """Embed texts by item id, sending only entries missing from the cache in one batch"""
+        # Keys include the text hash so an edited description is embedded again
+        keys = {item_id: (item_id, hash(text)) for item_id, text in texts.items()}
+        missing = [item_id for item_id, key in keys.items() if key not in cache]
+        
+        if missing:
+            embeddings = self.embed_batch([texts[item_id] for item_id in missing])
+            for item_id, embedding in zip(missing, embeddings):
+                cache[keys[item_id]] = embedding
+        
+        return {item_id: cache[key] for item_id, key in keys.items() if key in cache}
+
     def _build_conversation_context(self, user_input: str, context: Optional[Dict[str, Any]] = None) -> List[Dict[str, str]]:
         """Build conversation context for the AI model"""
         messages = [{"role": "system", "content": self.system_prompt}]
@@ -178,24 +280,25 @@ Always be ready to explain STPA concepts, guide methodology application, and hel
                 
         return "; ".join(context_parts)
 
+    def _build_chat_payload(self, messages: List[Dict[str, str]], stream: bool) -> Dict[str, Any]:
+        """Build the request payload for Ollama's /api/chat endpoint"""
+        return {
+            "model": self.config.model,
+            "messages": messages,
+            "stream": stream,
+            "options": {
+                "temperature": self.config.temperature,
+                "num_predict": self.config.max_tokens
+            }
+        }
+
     def _call_ollama(self, messages: List[Dict[str, str]]) -> Optional[str]:
         """Make the actual API call to Ollama"""
         try:
-            # Prepare the request payload
-            payload = {
-                "model": self.config.model,
-                "messages": messages,
-                "stream": False,
-                "options": {
-                    "temperature": self.config.temperature,
-                    "num_predict": self.config.max_tokens
-                }
-            }
-            
             # Make the request
             response = requests.post(
                 f"{self.config.base_url}/api/chat",
-                json=payload,
+                json=self._build_chat_payload(messages, stream=False),
                 timeout=self.config.timeout
             )
             
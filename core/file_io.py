@@ -2,7 +2,9 @@
 File I/O operations for the STPA model.
 """
 
+import copy
 import json
+import os
 import networkx as nx
 from typing import Dict, Any, Tuple, List, Optional, Union
 from pathlib import Path
@@ -14,6 +16,9 @@ from core.constants import VERSION
 # Get logger for this module
 logger = logging.getLogger(__name__)
 
+# Saved files are written in one buffered write
+_WRITE_BUFFER_SIZE = 1 << 20
+
 
 class STPAModelIO:
     """Input/output operations for STPA model data."""
@@ -21,14 +26,17 @@ class STPAModelIO:
     @staticmethod
     def save_json(model: STPAModel, file_path: Union[str, Path]) -> None:
         """Save the STPA model to JSON format"""
+        STPAModelIO.save_json_from_snapshot(STPAModelIO._model_to_dict(model), file_path)
+    
+    @staticmethod
+    def save_json_from_snapshot(snapshot: Dict[str, Any], file_path: Union[str, Path]) -> None:
+        """Save a model snapshot (see snapshot()) to JSON format"""
         file_path_str = str(file_path)
         logger.info(f"Saving model to {file_path_str}")
         
         try:
-            data = STPAModelIO._model_to_dict(model)
-            
-            with open(file_path_str, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            payload = STPAModelIO.dumps_snapshot(snapshot)
+            STPAModelIO._write_atomic(file_path_str, payload.encode('utf-8'))
             
             logger.info(f"Successfully saved model to {file_path_str}")
         except (IOError, OSError) as e:
@@ -41,6 +49,57 @@ class STPAModelIO:
             logger.error(f"Unexpected error saving model: {str(e)}")
             raise RuntimeError(f"Unexpected error saving model: {str(e)}")
     
+    @staticmethod
+    def snapshot(model: STPAModel) -> Dict[str, Any]:
+        """Take a plain-data copy of the model that can be saved from another thread"""
+        return copy.deepcopy(STPAModelIO._model_to_dict(model))
+    
+    @staticmethod
+    def dumps_json(model: STPAModel) -> str:
+        """Serialize the STPA model to a JSON string"""
+        return STPAModelIO.dumps_snapshot(STPAModelIO._model_to_dict(model))
+    
+    @staticmethod
+    def dumps_snapshot(snapshot: Dict[str, Any]) -> str:
+        """Serialize a model snapshot (see snapshot()) to a JSON string"""
+        return json.dumps(snapshot, ensure_ascii=False, indent=2)
+    
+    @staticmethod
+    def _write_atomic(file_path_str: str, payload: bytes) -> None:
+        """Write payload to a temp file next to the target, then swap it into place"""
+        directory, name = os.path.split(os.path.abspath(file_path_str))
+        fd, tmp_path = STPAModelIO._create_temp_file(directory, name)
+        try:
+            with os.fdopen(fd, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            # New files already got the umask-based mode; keep an existing file's mode
+            try:
+                os.chmod(tmp_path, os.stat(file_path_str).st_mode & 0o7777)
+            except FileNotFoundError:
+                pass
+            os.replace(tmp_path, file_path_str)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+    
+    @staticmethod
+    def _create_temp_file(directory: str, name: str) -> Tuple[int, str]:
+        """Create a unique temp file with the permissions a plain open() would give"""
+        flags = os.O_CREAT | os.O_EXCL | os.O_WRONLY | getattr(os, 'O_BINARY', 0)
+        for _ in range(100):
+            tmp_path = os.path.join(directory, f".{name}.{os.urandom(4).hex()}.tmp")
+            try:
+                # The kernel applies the process umask to 0o666
+                return os.open(tmp_path, flags, 0o666), tmp_path
+            except FileExistsError:
+                continue
+        raise FileExistsError(f"Could not create a temporary file in {directory}")
+    
     @staticmethod
     def load_json(file_path: Union[str, Path]) -> STPAModel:
         """Load STPA model from JSON format"""
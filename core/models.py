@@ -3,7 +3,7 @@ Core data models for STPA.
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any, Tuple, Union, Set
+from typing import Callable, Dict, List, Optional, Any, Tuple, Union, Set
 from datetime import datetime
 from enum import Enum
 import json
@@ -306,6 +306,8 @@ class ControlStructure(nx.MultiDiGraph):
     """System of Systems / Control Structure representation using NetworkX MultiDiGraph"""
     
     def __init__(self):
+        # Bumped on every structural change, so derived data can tell when to rebuild
+        self.revision = 0
         super().__init__()
         self._id_generator = IDGenerator()
     
@@ -315,6 +317,7 @@ class ControlStructure(nx.MultiDiGraph):
         # Add to NetworkX graph with node data as attributes (excluding id to avoid duplication)
         node_attrs = {k: v for k, v in node.__dict__.items() if k != 'id'}
         super().add_node(node_id, **node_attrs)
+        self.revision += 1
         
         # Register ID with generator
         self._id_generator.register_node_id(node_id)
@@ -330,12 +333,19 @@ class ControlStructure(nx.MultiDiGraph):
         link = ControlLink(id=link_id, source_id=source_id, target_id=target_id, **kwargs)
         # Add to NetworkX graph with link data as attributes
         super().add_edge(source_id, target_id, key=link_id, **link.__dict__)
+        self.revision += 1
         
         # Register ID with generator
         self._id_generator.register_link_id(link_id)
         
         return link
     
+    def add_edge(self, u_for_edge, v_for_edge, key=None, **attr):
+        """Add an edge and bump the revision"""
+        key = super().add_edge(u_for_edge, v_for_edge, key, **attr)
+        self.revision += 1
+        return key
+    
     def get_node_data(self, node_id: str) -> Optional[SystemNode]:
         """Get a node's data as SystemNode object"""
         if node_id in self.nodes:
@@ -347,17 +357,20 @@ class ControlStructure(nx.MultiDiGraph):
         """Remove a node and all its connected links"""
         if node_id in self.nodes:
             super().remove_node(node_id)  # NetworkX automatically removes connected edges
+            self.revision += 1
             # Invalidate ID cache since structure changed
             self._id_generator.invalidate_cache()
     
     def remove_edge(self, u, v, key=None) -> None:
         """Remove an edge and invalidate cache"""
         super().remove_edge(u, v, key)
+        self.revision += 1
         self._id_generator.invalidate_cache()
     
     def clear(self) -> None:
         """Clear all nodes and edges"""
         super().clear()
+        self.revision += 1
         self._id_generator.invalidate_cache()
     
     def get_next_node_id(self) -> str:
@@ -405,6 +418,28 @@ class STPAModel:
         "scenarios": ""
     })
     
+    # Callbacks run by notify_changed() (runtime only, never serialized)
+    _change_listeners: List[Callable[[Optional[str]], None]] = field(
+        default_factory=list, init=False, repr=False, compare=False)
+    
+    def add_change_listener(self, listener: Callable[[Optional[str]], None]) -> None:
+        """Register a callable to run whenever the model reports a change"""
+        if listener not in self._change_listeners:
+            self._change_listeners.append(listener)
+    
+    def remove_change_listener(self, listener: Callable[[Optional[str]], None]) -> None:
+        """Unregister a change listener (no-op if it was never added)"""
+        if listener in self._change_listeners:
+            self._change_listeners.remove(listener)
+    
+    def notify_changed(self, section: Optional[str] = None) -> None:
+        """Tell all change listeners that the model was edited (section names the editor, if any)"""
+        if section == "control_structure":
+            # Attribute edits made in place don't go through the graph's methods
+            self.control_structure.revision += 1
+        for listener in list(self._change_listeners):
+            listener(section)
+    
     def add_loss(self, description: str, severity: str = "", rationale: str = "") -> Loss:
         """Add a new loss to the model"""
         loss = Loss(description=description, severity=severity, rationale=rationale)
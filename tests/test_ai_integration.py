@@ -2,7 +2,9 @@
 Tests for AI integration functionality
 """
 
+import asyncio
 import unittest
+from unittest import mock
 import sys
 import os
 
@@ -63,6 +65,78 @@ class TestAIIntegration(unittest.TestCase):
         self.assertIn("STPA", response)
         self.assertIn("methodology", response.lower())
         
+    def test_async_fallback_response(self):
+        """Test the async wrapper returns the same fallback text"""
+        invalid_manager = OllamaAIManager(AIConfig(base_url="http://invalid:9999"))
+        
+        response = asyncio.run(invalid_manager.agenerate_response("help me with STPA"))
+        self.assertIn("methodology", response.lower())
+        
+    def test_stream_fallback_response(self):
+        """Test streaming yields the fallback text when AI is unavailable"""
+        invalid_manager = OllamaAIManager(AIConfig(base_url="http://invalid:9999"))
+        
+        chunks = list(invalid_manager.stream_response("help me with STPA"))
+        self.assertEqual(len(chunks), 1)
+        self.assertIn("methodology", chunks[0].lower())
+        
+    def test_stream_response_chunks(self):
+        """Test streamed chunks are yielded in order and recorded in history"""
+        manager = OllamaAIManager(AIConfig(base_url="http://localhost:9999"))
+        lines = [
+            b'{"message": {"content": "Control "}, "done": false}',
+            b'',
+            b'{"message": {"content": "action"}, "done": false}',
+            b'{"message": {"content": ""}, "done": true}',
+        ]
+        response = mock.MagicMock(status_code=200)
+        response.iter_lines.return_value = lines
+        response.__enter__.return_value = response
+        
+        with mock.patch("core.ai_integration.requests.post", return_value=response) as post:
+            chunks = list(manager.stream_response("What is a control action?"))
+        
+        self.assertEqual(chunks, ["Control ", "action"])
+        self.assertTrue(post.call_args.kwargs["json"]["stream"])
+        self.assertEqual(manager.conversation_history[-1],
+                         {"role": "assistant", "content": "Control action"})
+        
+    def test_async_stream_fallback_response(self):
+        """Test the async stream wrapper yields the same fallback text"""
+        invalid_manager = OllamaAIManager(AIConfig(base_url="http://invalid:9999"))
+        
+        async def collect():
+            return [chunk async for chunk in invalid_manager.astream_response("help me with STPA")]
+        
+        chunks = asyncio.run(collect())
+        self.assertIn("methodology", "".join(chunks).lower())
+        
+    def test_embed_batch_unavailable(self):
+        """Test batch embedding degrades to an empty result without Ollama"""
+        invalid_manager = OllamaAIManager(AIConfig(base_url="http://invalid:9999"))
+        
+        self.assertEqual(invalid_manager.embed_batch([]), [])
+        self.assertEqual(invalid_manager.embed_batch(["a pump", "a valve"]), [])
+        
+    def test_embed_cached_sends_only_missing(self):
+        """Test cached embeddings skip unchanged texts and batch the rest"""
+        manager = OllamaAIManager(AIConfig(base_url="http://invalid:9999"))
+        batches = []
+        
+        def fake_embed_batch(texts):
+            batches.append(list(texts))
+            return [[float(len(text))] for text in texts]
+        
+        manager.embed_batch = fake_embed_batch
+        cache = {}
+        
+        result = manager.embed_cached({"n1": "pump", "n2": "valve"}, cache)
+        self.assertEqual(result, {"n1": [4.0], "n2": [5.0]})
+        
+        result = manager.embed_cached({"n1": "pump", "n2": "relief valve"}, cache)
+        self.assertEqual(result["n2"], [12.0])
+        self.assertEqual(batches, [["pump", "valve"], ["relief valve"]])
+        
     def test_context_formatting(self):
         """Test context information formatting"""
         context = {
@@ -162,7 +162,69 @@ class TestSTPAModelIO(unittest.TestCase):
         # Test invalid file path
         with self.assertRaises(IOError):
             STPAModelIO.save_json(self.model, "/invalid/path/that/does/not/exist.json")
-            
+
+    def test_dumps_json(self):
+        """Test serializing a model to a JSON string"""
+        payload = STPAModelIO.dumps_json(self.model)
+        self.assertEqual(json.loads(payload), STPAModelIO._model_to_dict(self.model))
+
+    def test_save_json_from_snapshot(self):
+        """Test that a snapshot is detached from later model edits"""
+        snapshot = STPAModelIO.snapshot(self.model)
+        self.model.name = "Edited after snapshot"
+        self.model.metadata['edited'] = True
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = os.path.join(temp_dir, "model.json")
+            STPAModelIO.save_json_from_snapshot(snapshot, temp_path)
+            loaded_model = STPAModelIO.load_json(temp_path)
+
+        self.assertNotEqual(loaded_model.name, "Edited after snapshot")
+        self.assertNotIn('edited', loaded_model.metadata)
+
+    def test_save_json_replaces_file_atomically(self):
+        """Test that saving over an existing file leaves no temp files behind"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = os.path.join(temp_dir, "model.json")
+            with open(temp_path, 'w') as f:
+                f.write("old content")
+            os.chmod(temp_path, 0o640)
+
+            STPAModelIO.save_json(self.model, temp_path)
+
+            self.assertEqual(os.listdir(temp_dir), ["model.json"])
+            self.assertEqual(os.stat(temp_path).st_mode & 0o777, 0o640)
+            self.assertEqual(STPAModelIO.load_json(temp_path).name, self.model.name)
+
+    def test_save_json_new_file_uses_umask(self):
+        """Test that a newly saved file gets the same mode as a plain open() would"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            plain_path = os.path.join(temp_dir, "plain.json")
+            with open(plain_path, 'w') as f:
+                f.write("{}")
+            temp_path = os.path.join(temp_dir, "model.json")
+
+            STPAModelIO.save_json(self.model, temp_path)
+
+            self.assertEqual(os.stat(temp_path).st_mode & 0o777,
+                             os.stat(plain_path).st_mode & 0o777)
+
+    def test_save_json_failure_keeps_original(self):
+        """Test that a failed save does not touch the existing file"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = os.path.join(temp_dir, "model.json")
+            STPAModelIO.save_json(self.model, temp_path)
+            with open(temp_path, 'r') as f:
+                original = f.read()
+
+            self.model.metadata['unserializable'] = object()
+            with self.assertRaises(ValueError):
+                STPAModelIO.save_json(self.model, temp_path)
+
+            self.assertEqual(os.listdir(temp_dir), ["model.json"])
+            with open(temp_path, 'r') as f:
+                self.assertEqual(f.read(), original)
+
     def test_load_json_error_handling(self):
         """Test error handling in load_json"""
         # Test non-existent file
@@ -303,6 +303,29 @@ class TestControlStructure(unittest.TestCase):
         self.assertNotIn("node1", self.cs.nodes)
         self.assertEqual(len(self.cs.edges), 1)  # Only link2 should remain
 
+    def test_revision_tracks_structural_changes(self):
+        """Test that every structural change bumps the revision"""
+        revisions = [self.cs.revision]
+        self.cs.add_node_with_data("node1", "Controller")
+        revisions.append(self.cs.revision)
+        self.cs.add_node("node2", "Actuator")
+        revisions.append(self.cs.revision)
+        self.cs.add_link("link1", "node1", "node2")
+        revisions.append(self.cs.revision)
+        self.cs.add_edge("node2", "node1", key="link2")
+        revisions.append(self.cs.revision)
+        self.cs.remove_edge("node2", "node1", "link2")
+        revisions.append(self.cs.revision)
+        self.cs.remove_node_with_links("node2")
+        revisions.append(self.cs.revision)
+        self.cs.clear()
+        revisions.append(self.cs.revision)
+        self.assertEqual(revisions, sorted(set(revisions)))
+
+        # Reading the graph leaves the revision alone
+        list(self.cs.edges(keys=True, data=True))
+        self.assertEqual(self.cs.revision, revisions[-1])
+
     def test_id_conflict_prevention(self):
         """Test that adding nodes doesn't cause 'multiple values for keyword argument id' error"""
         # This test verifies the fix for the bug where sync_to_model would fail
@@ -437,6 +460,37 @@ class TestSTPAModel(unittest.TestCase):
         next_id = self.model.get_next_link_id()
         self.assertEqual(next_id, "e1")
 
+    def test_change_listeners(self):
+        """Test registering, notifying and removing change listeners"""
+        calls = []
+        listener = calls.append
+
+        self.model.add_change_listener(listener)
+        self.model.add_change_listener(listener)  # duplicates are ignored
+        self.model.notify_changed()
+        self.model.notify_changed("uca")
+        self.assertEqual(calls, [None, "uca"])
+
+        self.model.remove_change_listener(listener)
+        self.model.remove_change_listener(listener)  # removing twice is harmless
+        self.model.notify_changed()
+        self.assertEqual(calls, [None, "uca"])
+
+    def test_control_structure_change_bumps_revision(self):
+        """Test that reporting a control structure edit bumps its revision"""
+        revision = self.model.control_structure.revision
+        self.model.notify_changed("uca")
+        self.assertEqual(self.model.control_structure.revision, revision)
+        self.model.notify_changed("control_structure")
+        self.assertGreater(self.model.control_structure.revision, revision)
+
+    def test_change_listeners_not_part_of_model_data(self):
+        """Test that listeners stay out of the constructor and repr"""
+        self.model.add_change_listener(lambda section: None)
+        self.assertNotIn("_change_listeners", repr(self.model))
+        with self.assertRaises(TypeError):
+            STPAModel(_change_listeners=[])
+
 
 class TestIDGenerator(unittest.TestCase):
     """Test cases for the IDGenerator optimization"""
@@ -6,6 +6,7 @@ from typing import Dict, List, Optional, Tuple, Set
 import json
 import math
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 
 from PySide6.QtWidgets import (
@@ -17,7 +18,7 @@ from PySide6.QtWidgets import (
     QComboBox, QDialogButtonBox, QCheckBox, QToolBar,
     QFileDialog, QGraphicsProxyWidget, QApplication, QPlainTextEdit
 )
-from PySide6.QtCore import Qt, QPointF, QRectF, Signal, QLineF
+from PySide6.QtCore import Qt, QPointF, QRectF, QLineF
 from PySide6.QtGui import (
     QPen, QBrush, QColor, QPainter, QPolygonF, QPainterPath, QFont,
     QAction, QTransform, QCursor, QActionGroup
@@ -62,6 +63,8 @@ class CommandManager:
         self.max_history = max_history
         self.history: List[Command] = []
         self.current_index = -1
+        self._batch_depth = 0  # > 0 while commands are executed as one batch
+        self._update_pending = False
     
     def execute_command(self, command: Command):
         """Execute a command and add it to history"""
@@ -82,7 +85,22 @@ class CommandManager:
         
         # Update UI if parent has the update method
         if hasattr(self, '_update_callback'):
-            self._update_callback()
+            if self._batch_depth:
+                self._update_pending = True
+            else:
+                self._update_callback()
+    
+    @contextmanager
+    def batch(self):
+        """Execute several commands, calling the update callback once at the end"""
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._update_pending:
+                self._update_pending = False
+                self._update_callback()
     
     def set_update_callback(self, callback):
         """Set a callback to be called after command execution"""
@@ -335,7 +353,7 @@ class ChangeNodePropertyCommand(Command):
             self.node_item.update_text_rect()
             self.node_item.update()
         elif self.property_name == 'states':
-            self.node_item.data.states = list(value) if isinstance(value, (list, tuple)) else [str(value)]
+            self.node_item.data.set_states(list(value) if isinstance(value, (list, tuple)) else [str(value)])
             self.scene.G.nodes[self.node_id]['states'] = self.node_item.data.states
         elif self.property_name == 'shape':
             self.node_item.data.shape = str(value)
@@ -478,6 +496,16 @@ class NodeData:
     states: List[str] = field(default_factory=list)
     shape: str = "circle"  # "circle", "rectangle", "hexagon"
     size: float = DEFAULT_NODE_SIZE     # radius for circle, half-width/height for others
+    # Properties pane text for states, rebuilt only when the states are replaced
+    states_display: str = field(default="", init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.set_states(self.states)
+    
+    def set_states(self, states: list):
+        """Replace the states and rebuild their properties pane text"""
+        self.states = states
+        self.states_display = PropertiesPane._format_states(states)
 
 @dataclass
 class EdgeData:
@@ -1355,9 +1383,6 @@ class GraphView(QGraphicsView):
 class ControlStructureTab(QWidget):
     """Full-featured control structure editor tab"""
     
-    # Signals
-    model_changed = Signal()
-    
     def __init__(self, model: STPAModel, main_window=None):
         super().__init__()
         
@@ -1417,7 +1442,7 @@ class ControlStructureTab(QWidget):
         
         # Properties panel
         self.properties_panel = PropertiesPane(self)
-        self.properties_panel.property_changed.connect(self._on_property_changed)
+        self.properties_panel.properties_changed.connect(self._on_properties_changed)
         right_layout.addWidget(self.properties_panel)
         
         # Chat panel
@@ -1552,12 +1577,16 @@ class ControlStructureTab(QWidget):
     def set_model(self, model: STPAModel):
         """Set a new model and refresh the view"""
         self.model = model
+        self.chat_panel.set_model(model)
         self._load_from_model()
         if self.main_window:
             self.main_window._update_window_title()
     
     def sync_to_model(self):
         """Update the model with current graph state"""
+        # Apply property edits still waiting on the debounce timers
+        self.properties_panel.flush_pending_edits()
+        
         # Sync node positions to graph
         for node in self.scene.iter_nodes():
             self.scene._sync_node_to_graph(node)
@@ -1701,6 +1730,7 @@ class ControlStructureTab(QWidget):
         """Called after any command is executed"""
         self._update_undo_redo_buttons()
         self._update_status()
+        self.model.notify_changed("control_structure")
         
         # Refresh properties panel if an item is selected
         selected_items = self.scene.selectedItems()
@@ -1728,6 +1758,7 @@ class ControlStructureTab(QWidget):
                 'description': '',
                 'position': (item.scenePos().x(), item.scenePos().y()),
                 'states': item.data.states,
+                '_states_display': item.data.states_display,
                 'shape': item.data.shape,
                 'size': item.data.size
             }
@@ -1748,33 +1779,32 @@ class ControlStructureTab(QWidget):
         else:
             self.properties_panel.clear_properties()
     
-    def _on_property_changed(self, item_id: str, property_name: str, value):
-        """Handle property changes from properties panel using command system"""
-        # Find the node and create property change command
+    def _on_properties_changed(self, item_id: str, changes: dict):
+        """Handle a batch of property changes from properties panel using command system"""
+        # Find the node and create property change commands
         for node in self.scene.iter_nodes():
             if str(node.node_id) == item_id:
-                # Get the old value
-                old_value = self._get_node_property_value(node, property_name)
-                
-                # Only create command if value actually changed
-                if old_value != value:
-                    command = ChangeNodePropertyCommand(self.scene, node, property_name, old_value, value)
-                    self.scene.command_manager.execute_command(command)
-                    self.model_changed.emit()
+                # One UI refresh and model notification for the whole batch
+                with self.scene.command_manager.batch():
+                    for property_name, value in changes.items():
+                        # Only create command if value actually changed
+                        old_value = self._get_node_property_value(node, property_name)
+                        if old_value != value:
+                            command = ChangeNodePropertyCommand(self.scene, node, property_name, old_value, value)
+                            self.scene.command_manager.execute_command(command)
                 return
         
         # Handle edge property changes
         for edge in self.scene.iter_edges():
             edge_id = f"{edge.src.node_id}->{edge.dst.node_id}"
             if edge_id == item_id:
-                # Get the old value
-                old_value = self._get_edge_property_value(edge, property_name)
-                
-                # Only create command if value actually changed
-                if old_value != value:
-                    command = ChangeEdgePropertyCommand(self.scene, edge, property_name, old_value, value)
-                    self.scene.command_manager.execute_command(command)
-                    self.model_changed.emit()
+                with self.scene.command_manager.batch():
+                    for property_name, value in changes.items():
+                        # Only create command if value actually changed
+                        old_value = self._get_edge_property_value(edge, property_name)
+                        if old_value != value:
+                            command = ChangeEdgePropertyCommand(self.scene, edge, property_name, old_value, value)
+                            self.scene.command_manager.execute_command(command)
                 return
     
     def _get_node_property_value(self, node: NodeItem, property_name: str):
@@ -1816,7 +1846,7 @@ class ControlStructureTab(QWidget):
             node.data.name = new_name.strip()
             self.G.nodes[node.node_id]['name'] = new_name.strip()
             node.update()  # Trigger repaint
-            self.model_changed.emit()
+            self.model.notify_changed("control_structure")
     
     def _rename_edge(self, edge: EdgeItem):
         """Rename an edge via input dialog"""
@@ -1824,7 +1854,7 @@ class ControlStructureTab(QWidget):
         if ok and new_name.strip():
             edge.data.name = new_name.strip()
             self.G[edge.src.node_id][edge.dst.node_id][edge.edge_key]['name'] = new_name.strip()
-            self.model_changed.emit()
+            self.model.notify_changed("control_structure")
     
     # File operations
     def auto_layout(self):
@@ -1846,7 +1876,7 @@ class ControlStructureTab(QWidget):
             for edge in self.scene.iter_edges():
                 edge.update_path()
             
-            self.model_changed.emit()
+            self.model.notify_changed("control_structure")
             self.status_label.setText("Auto-layout applied successfully")
             
         except ImportError:
@@ -8,7 +8,7 @@ from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QTextEdit,
     QFormLayout, QGroupBox, QPushButton, QMessageBox, QSplitter
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt
 
 from core.models import STPAModel
 from ui.shared_components import TabChatPanel
@@ -18,9 +18,6 @@ from ui.document_widget import DocumentWidget
 class SystemDescriptionTab(QWidget):
     """Tab for editing system description and general information"""
     
-    # Signals
-    model_changed = Signal()
-    
     def __init__(self, model: STPAModel, main_window=None):
         super().__init__()
         
@@ -153,6 +150,7 @@ class SystemDescriptionTab(QWidget):
     def set_model(self, model: STPAModel):
         """Set a new model and refresh the view"""
         self.model = model
+        self.chat_panel.set_model(model)
         self.document_widget.set_model(model)
         self._load_from_model()
         if self.main_window:
@@ -205,7 +203,7 @@ class SystemDescriptionTab(QWidget):
             self.main_window._update_window_title()
         
         self.status_label.setText("Changes saved to model")
-        self.model_changed.emit()
+        self.model.notify_changed("description")
     
     def _on_field_changed(self):
         """Handle field changes for auto-save"""
@@ -218,9 +216,11 @@ class SystemDescriptionTab(QWidget):
             self.model.name = self.name_edit.text().strip() or "Untitled STPA Model"
             if self.main_window:
                 self.main_window._update_window_title()
-            self.model_changed.emit()
+        
+        # The remaining fields reach the model in sync_to_model
+        self.model.notify_changed("description")
     
     def _on_documents_changed(self):
         """Handle document changes"""
-        self.model_changed.emit()
+        self.model.notify_changed("description")
         self.status_label.setText("Document changes saved to model")
@@ -10,7 +10,7 @@ from PySide6.QtWidgets import (
     QFormLayout, QLineEdit, QDialog, QDialogButtonBox, QMessageBox,
     QInputDialog
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt
 
 from core.models import STPAModel, Loss, Hazard
 from core.validation import InputValidator, ValidationError
@@ -20,9 +20,6 @@ from ui.shared_components import TabChatPanel
 class LossesHazardsTab(QWidget):
     """Tab for managing losses and hazards"""
     
-    # Signals
-    model_changed = Signal()
-    
     def __init__(self, model: STPAModel, main_window=None):
         super().__init__()
         
@@ -167,6 +164,7 @@ class LossesHazardsTab(QWidget):
     def set_model(self, model: STPAModel):
         """Set a new model and refresh the view"""
         self.model = model
+        self.chat_panel.set_model(model)
         self._refresh_lists()
     
     def sync_to_model(self):
@@ -252,7 +250,7 @@ class LossesHazardsTab(QWidget):
             self.model.losses.append(loss)
             
             self._refresh_lists()
-            self.model_changed.emit()
+            self.model.notify_changed("losses_hazards")
     
     def edit_selected_loss(self):
         """Edit the selected loss"""
@@ -274,7 +272,7 @@ class LossesHazardsTab(QWidget):
                     setattr(loss, key, value)
                 
                 self._refresh_lists()
-                self.model_changed.emit()
+                self.model.notify_changed("losses_hazards")
     
     def delete_selected_loss(self):
         """Delete the selected loss"""
@@ -296,7 +294,7 @@ class LossesHazardsTab(QWidget):
             if reply == QMessageBox.Yes:
                 del self.model.losses[loss_index]
                 self._refresh_lists()
-                self.model_changed.emit()
+                self.model.notify_changed("losses_hazards")
     
     def add_hazard(self):
         """Add a new hazard"""
@@ -307,7 +305,7 @@ class LossesHazardsTab(QWidget):
             self.model.hazards.append(hazard)
             
             self._refresh_lists()
-            self.model_changed.emit()
+            self.model.notify_changed("losses_hazards")
     
     def edit_selected_hazard(self):
         """Edit the selected hazard"""
@@ -329,7 +327,7 @@ class LossesHazardsTab(QWidget):
                     setattr(hazard, key, value)
                 
                 self._refresh_lists()
-                self.model_changed.emit()
+                self.model.notify_changed("losses_hazards")
     
     def delete_selected_hazard(self):
         """Delete the selected hazard"""
@@ -351,7 +349,7 @@ class LossesHazardsTab(QWidget):
             if reply == QMessageBox.Yes:
                 del self.model.hazards[hazard_index]
                 self._refresh_lists()
-                self.model_changed.emit()
+                self.model.notify_changed("losses_hazards")
 
 
 class LossDialog(QDialog):
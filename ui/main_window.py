@@ -2,16 +2,20 @@
 Main window for Eir.
 """
 
+import functools
 import sys
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Iterator, Optional, Set, Tuple
 
 from PySide6.QtWidgets import (
     QMainWindow, QTabWidget, QMenuBar, QStatusBar, QMessageBox, 
     QFileDialog, QVBoxLayout, QWidget, QApplication, QLabel, QPushButton,
-    QSizePolicy, QToolBar
+    QSizePolicy, QToolBar, QToolButton, QProgressDialog
+)
+from PySide6.QtCore import (
+    Qt, QIODevice, QObject, QRunnable, QSaveFile, QThreadPool, QTimer, Signal, Slot
 )
-from PySide6.QtCore import Qt
 from PySide6.QtGui import QAction, QPixmap, QIcon
 
 from core.models import STPAModel
@@ -24,9 +28,116 @@ from ui.uca_analysis_tab import UCAAnalysisTab
 from ui.help_system import HelpPanel
 
 
+# Application logo, resolved once at import
+_LOGO_PATH = Path(__file__).resolve().parent.parent / "eir2.png"
+_LOGO_EXISTS = _LOGO_PATH.exists()
+
+# Toolbar stylesheets
+_TITLE_LABEL_QSS = "font-weight: bold; font-size: 14px; margin: 0 10px;"
+_HELP_BUTTON_QSS = """
+QToolButton {
+    border-radius: 15px;
+    background-color: #4CAF50;
+    color: white;
+    font-weight: bold;
+    font-size: 14px;
+}
+QToolButton:hover {
+    background-color: #45a049;
+}
+QToolButton:pressed {
+    background-color: #3d8b40;
+}
+"""
+
+
+class _SaveSignals(QObject):
+    """Signals emitted by a background save"""
+    finished = Signal(str)  # path
+    error = Signal(str)  # error message
+
+
+class _SaveWorker(QRunnable):
+    """Writes a model snapshot to disk on the global thread pool"""
+    
+    def __init__(self, snapshot: Dict[str, Any], path: str):
+        super().__init__()
+        self.signals = _SaveSignals()
+        self._snapshot = snapshot
+        self._path = path
+    
+    def run(self):
+        """Save the snapshot as JSON in the pool thread"""
+        try:
+            payload = STPAModelIO.dumps_snapshot(self._snapshot).encode('utf-8')
+        except (TypeError, ValueError) as e:
+            self.signals.error.emit(f"Failed to serialize model data: {e}")
+            return
+        
+        # QSaveFile writes to a temporary file and only replaces the target on commit();
+        # an uncommitted QSaveFile discards its temporary file
+        save_file = QSaveFile(self._path)
+        if (not save_file.open(QIODevice.WriteOnly)
+                or save_file.write(payload) != len(payload)
+                or not save_file.commit()):
+            self.signals.error.emit(f"Failed to write to file '{self._path}': {save_file.errorString()}")
+            return
+        self.signals.finished.emit(self._path)
+
+
+class _LoadSignals(QObject):
+    """Signals emitted by a background load"""
+    loaded = Signal(str, object)  # path, STPAModel
+    failed = Signal(str, object)  # path, exception
+
+
+class _LoadWorker(QRunnable):
+    """Reads and parses a model file on the global thread pool"""
+    
+    def __init__(self, path: str):
+        super().__init__()
+        self.signals = _LoadSignals()
+        self._path = path
+    
+    def run(self):
+        """Load the JSON model in the pool thread (builds no widgets)"""
+        try:
+            model = STPAModelIO.load_json(self._path)
+        except Exception as e:
+            self.signals.failed.emit(self._path, e)
+        else:
+            self.signals.loaded.emit(self._path, model)
+
+
 class STPAMainWindow(QMainWindow):
     """Main window with tabbed interface for STPA analysis"""
     
+    # Help context for each tab, indexed by tab position
+    _TAB_CONTEXTS = (
+        "control_structure",
+        "system_description",
+        "stpa_methodology",  # Losses & Hazards
+        "uca_analysis",
+        "stpa_methodology",  # Scenarios (future)
+    )
+    
+    # Menu layouts: (text, shortcut, slot name), None for a separator
+    _FILE_MENU = (
+        ("New", "Ctrl+N", "new_model"),
+        None,
+        ("Save", "Ctrl+S", "save_model"),
+        ("Save As...", "Ctrl+Shift+S", "save_model_as"),
+        None,
+        ("Load", "Ctrl+O", "load_model"),
+        None,
+        ("Exit", "Ctrl+Q", "close"),
+    )
+    _HELP_MENU = (
+        ("Show Help Panel", "F1", "show_help_panel"),
+        None,
+        ("About Eir", None, "show_about"),
+    )
+    
     def __init__(self):
         super().__init__()
         
@@ -36,6 +147,27 @@ class STPAMainWindow(QMainWindow):
         self._current_file_format: str = "json"  # "json" or "graphml"
         self._current_file_path: Optional[str] = None
         self._has_unsaved_changes: bool = False
+        self._saving: bool = False
+        self._change_count: int = 0  # bumped on every edit
+        self._save_target: Optional[Tuple[STPAModel, int]] = None  # model and change count being saved
+        self._save_worker: Optional[_SaveWorker] = None
+        self._load_worker: Optional[_LoadWorker] = None
+        self._load_progress: Optional[QProgressDialog] = None
+        self._last_help_context: Optional[str] = None
+        self._last_title: str = ""
+        self._dirty_tabs: Set[str] = set()  # model sections edited since the last sync
+        
+        # Coalesce bursts of tab switches into a single help refresh
+        self._help_refresh_timer = QTimer(self)
+        self._help_refresh_timer.setSingleShot(True)
+        self._help_refresh_timer.setInterval(0)
+        self._help_refresh_timer.timeout.connect(self._update_contextual_help)
+        
+        # Collapse bursts of model changes into one title update
+        self._title_update_timer = QTimer(self)
+        self._title_update_timer.setSingleShot(True)
+        self._title_update_timer.setInterval(50)
+        self._title_update_timer.timeout.connect(self._update_window_title)
         
         self._setup_ui()
         self._setup_menu()
@@ -72,6 +204,14 @@ class STPAMainWindow(QMainWindow):
         self.uca_analysis_tab = UCAAnalysisTab(self.model, self)
         self.tabs.addTab(self.uca_analysis_tab, "UCA Analysis")
         
+        # Tabs by the section name they pass to STPAModel.notify_changed()
+        self._tab_instances = {
+            "control_structure": self.control_structure_tab,
+            "description": self.description_tab,
+            "losses_hazards": self.losses_hazards_tab,
+            "uca": self.uca_analysis_tab,
+        }
+        
         # Tab 5: Loss Scenarios (placeholder for future)
         scenarios_placeholder = QWidget()
         self.tabs.addTab(scenarios_placeholder, "Scenarios (Future)")
@@ -79,6 +219,7 @@ class STPAMainWindow(QMainWindow):
         # Set up Help System (NEW!)
         self.help_panel = HelpPanel(self)
         self.addDockWidget(Qt.RightDockWidgetArea, self.help_panel)
+        self.help_panel.visibilityChanged.connect(self._on_help_visibility_changed)
         
         # Connect tab changes to help system for context-sensitive help
         self.tabs.currentChanged.connect(self._on_tab_changed)
@@ -94,11 +235,8 @@ class STPAMainWindow(QMainWindow):
         
         # Try to load and add logo
         try:
-            logo_path = Path(__file__).parent.parent / "eir2.png"
-            if logo_path.exists():
-                pixmap = QPixmap(str(logo_path))
-                # Scale logo to reasonable size
-                scaled_pixmap = pixmap.scaled(32, 32, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            scaled_pixmap = STPAMainWindow._logo_pixmap()
+            if scaled_pixmap is not None:
                 logo_label = QLabel()
                 logo_label.setPixmap(scaled_pixmap)
                 logo_label.setToolTip("Eir")
@@ -111,7 +249,7 @@ class STPAMainWindow(QMainWindow):
         
         # Add title label
         title_label = QLabel("Eir")
-        title_label.setStyleSheet("font-weight: bold; font-size: 14px; margin: 0 10px;")
+        title_label.setStyleSheet(_TITLE_LABEL_QSS)
         toolbar.addWidget(title_label)
         
         # Add stretch to push file operations to the right
@@ -140,6 +278,10 @@ class STPAMainWindow(QMainWindow):
         save_as_btn.clicked.connect(self.save_model_as)
         toolbar.addWidget(save_as_btn)
         
+        # Toolbar buttons never act as dialog defaults
+        for button in (new_btn, load_btn, save_btn, save_as_btn):
+            button.setAutoDefault(False)
+        
         # Add separator before help button
         toolbar.addSeparator()
         
@@ -149,127 +291,86 @@ class STPAMainWindow(QMainWindow):
         toolbar.addWidget(spacer)
         
         # Help button
-        help_button = QPushButton("?")
+        help_button = QToolButton()
+        help_button.setText("?")
         help_button.setToolTip("Show Help Panel (F1)")
         help_button.setFixedSize(30, 30)
-        help_button.setStyleSheet("""
-            QPushButton {
-                border-radius: 15px;
-                background-color: #4CAF50;
-                color: white;
-                font-weight: bold;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-            QPushButton:pressed {
-                background-color: #3d8b40;
-            }
-        """)
+        help_button.setStyleSheet(_HELP_BUTTON_QSS)
         help_button.clicked.connect(self.show_help_panel)
         toolbar.addWidget(help_button)
     
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _logo_pixmap() -> Optional[QPixmap]:
+        """Load the logo once, scaled to toolbar size (None if the file is missing)"""
+        if not _LOGO_EXISTS:
+            return None
+        return QPixmap(str(_LOGO_PATH)).scaled(32, 32, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    
     def _setup_menu(self):
         """Set up the menu bar"""
         menubar = self.menuBar()
         
-        # File menu
-        file_menu = menubar.addMenu("File")
-        
-        # New
-        new_action = QAction("New", self)
-        new_action.setShortcut("Ctrl+N")
-        new_action.triggered.connect(self.new_model)
-        file_menu.addAction(new_action)
-        
-        file_menu.addSeparator()
-        
-        # Save
-        save_action = QAction("Save", self)
-        save_action.setShortcut("Ctrl+S")
-        save_action.triggered.connect(self.save_model)
-        file_menu.addAction(save_action)
-        
-        # Save As
-        save_as_action = QAction("Save As...", self)
-        save_as_action.setShortcut("Ctrl+Shift+S")
-        save_as_action.triggered.connect(self.save_model_as)
-        file_menu.addAction(save_as_action)
-        
-        file_menu.addSeparator()
-        
-        # Load
-        load_action = QAction("Load", self)
-        load_action.setShortcut("Ctrl+O")
-        load_action.triggered.connect(self.load_model)
-        file_menu.addAction(load_action)
-        
-        file_menu.addSeparator()
-        
-        # Exit
-        exit_action = QAction("Exit", self)
-        exit_action.setShortcut("Ctrl+Q")
-        exit_action.triggered.connect(self.close)
-        file_menu.addAction(exit_action)
-        
-        # Help menu
-        help_menu = menubar.addMenu("Help")
-        
-        # Show Help Panel
-        help_panel_action = QAction("Show Help Panel", self)
-        help_panel_action.setShortcut("F1")
-        help_panel_action.triggered.connect(self.show_help_panel)
-        help_menu.addAction(help_panel_action)
-        
-        help_menu.addSeparator()
-        
-        about_action = QAction("About Eir", self)
-        about_action.triggered.connect(self.show_about)
-        help_menu.addAction(about_action)
-        
-        # Quick Help Button (as an action)
-        quick_help_action = QAction("? Quick Help", self)
-        quick_help_action.setShortcut("F1")
-        quick_help_action.triggered.connect(self.show_help_panel)
-        help_menu.addAction(quick_help_action)
+        self._add_menu_actions(menubar.addMenu("File"), self._FILE_MENU)
+        self._add_menu_actions(menubar.addMenu("Help"), self._HELP_MENU)
+    
+    def _add_menu_actions(self, menu, entries):
+        """Populate a menu from a (text, shortcut, slot name) table"""
+        for entry in entries:
+            if entry is None:
+                menu.addSeparator()
+                continue
+            text, shortcut, slot_name = entry
+            action = QAction(text, self)
+            if shortcut:
+                action.setShortcut(shortcut)
+            action.triggered.connect(getattr(self, slot_name))
+            menu.addAction(action)
     
     def _connect_signals(self):
         """Connect signals between tabs"""
-        # Connect model change signals to track unsaved changes
-        self.control_structure_tab.model_changed.connect(self._mark_as_changed)
-        self.description_tab.model_changed.connect(self._mark_as_changed)
-        self.losses_hazards_tab.model_changed.connect(self._mark_as_changed)
-        self.uca_analysis_tab.model_changed.connect(self._mark_as_changed)
+        # Tabs report edits through the model; track them as unsaved changes
+        self.model.add_change_listener(self._on_model_changed)
+    
+    def _on_model_changed(self, section: Optional[str]):
+        """Remember which tab edited the model and flag unsaved changes"""
+        if section in self._tab_instances:
+            self._dirty_tabs.add(section)
+        self._mark_as_changed()
     
+    @Slot()
     def _mark_as_changed(self):
         """Mark the model as having unsaved changes"""
+        self._change_count += 1
         self._has_unsaved_changes = True
-        self._update_window_title()
+        if not self._title_update_timer.isActive():
+            self._title_update_timer.start()
     
+    @Slot()
     def _mark_as_saved(self):
         """Mark the model as saved (no unsaved changes)"""
         self._has_unsaved_changes = False
         self._update_window_title()
     
     # File operations
+    @Slot()
     def new_model(self):
         """Create a new STPA model"""
+        if self._saving:
+            self.statusBar().showMessage("Save in progress - try again when it has finished")
+            return
         if self._confirm_unsaved_changes():
-            self.model = STPAModel()
             self._current_file_path = None
             self._current_file_format = "json"
             self._has_unsaved_changes = False
             
             # Notify all tabs of the new model
-            self.control_structure_tab.set_model(self.model)
-            self.description_tab.set_model(self.model)
-            self.losses_hazards_tab.set_model(self.model)
-            self.uca_analysis_tab.set_model(self.model)
+            self._install_model(STPAModel())
             
             self._update_window_title()
             self.statusBar().showMessage("New STPA model created")
     
+    @Slot()
     def save_model(self):
         """Save the current model"""
         if not self._current_file_path:
@@ -277,14 +378,10 @@ class STPAMainWindow(QMainWindow):
         
         try:
             self._save_model_to_path(self._current_file_path, self._current_file_format)
-            self._mark_as_saved()
-            self._update_window_title()
-            self.statusBar().showMessage(f"Model saved to {self._current_file_path}")
         except Exception as e:
-            error_msg = f"Could not save model: {str(e)}"
-            QMessageBox.critical(self, "Save Failed", error_msg)
-            self.statusBar().showMessage("Save failed")
+            self._on_save_failed(str(e))
     
+    @Slot()
     def save_model_as(self):
         """Save the model as JSON format"""
         # File save dialog - JSON only
@@ -303,18 +400,44 @@ class STPAMainWindow(QMainWindow):
             
         try:
             self._save_model_to_path(path, "json")
-            self._current_file_path = path
-            self._current_file_format = "json"
-            self._mark_as_saved()
-            self._update_window_title()
-            self.statusBar().showMessage(f"Model saved to {path}")
         except Exception as e:
-            error_msg = f"Could not save model: {str(e)}"
-            QMessageBox.critical(self, "Save Failed", error_msg)
-            self.statusBar().showMessage("Save failed")
+            self._on_save_failed(str(e))
+    
+    @Slot(str)
+    def _on_save_finished(self, path: str):
+        """Handle completion of a background save"""
+        self._saving = False
+        self._save_worker = None
+        saved_model, saved_changes = self._save_target
+        self._save_target = None
+        self.statusBar().showMessage(f"Model saved to {path}")
+        
+        if saved_model is not self.model:
+            return  # another model was installed meanwhile; the file isn't its own
+        self._current_file_path = path
+        self._current_file_format = "json"
+        if self._change_count == saved_changes:
+            self._mark_as_saved()  # also refreshes the window title
+        else:
+            # Edits made after the snapshot are not in the file
+            self._update_window_title()
+    
+    @Slot(str)
+    def _on_save_failed(self, message: str):
+        """Handle a failed save"""
+        self._saving = False
+        self._save_worker = None
+        self._save_target = None
+        error_msg = f"Could not save model: {message}"
+        QMessageBox.critical(self, "Save Failed", error_msg)
+        self.statusBar().showMessage("Save failed")
     
+    @Slot()
     def load_model(self):
         """Load an Eir model (JSON format)"""
+        if self._saving:
+            self.statusBar().showMessage("Save in progress - try again when it has finished")
+            return
         if not self._confirm_unsaved_changes():
             return
 
@@ -327,56 +450,150 @@ class STPAMainWindow(QMainWindow):
         
         if not path:
             return
-            
-        try:
-            self._load_model_from_path(path)
-            self._current_file_path = path
-            self._current_file_format = "json"
-            self._has_unsaved_changes = False
-            
-            self._update_window_title()
-            self.statusBar().showMessage(f"Model loaded from {path}")
-            
-        except FileNotFoundError:
-            error_msg = f"File not found: {path}"
-            QMessageBox.critical(self, "Load Failed", error_msg)
-            self.statusBar().showMessage("Load failed - file not found")
-        except ValueError as e:
-            error_msg = f"Invalid file format: {str(e)}"
-            QMessageBox.critical(self, "Load Failed", error_msg)
-            self.statusBar().showMessage("Load failed - invalid format")
-        except Exception as e:
-            error_msg = f"Could not load model: {str(e)}"
-            QMessageBox.critical(self, "Load Failed", error_msg)
-            self.statusBar().showMessage("Load failed")
+        
+        self._load_model_from_path(path)
     
     def _save_model_to_path(self, path: str, format_type: str):
-        """Save model to specific path (JSON only)"""
-        # Update model with current tab states
+        """Save model to specific path (JSON only) on a background thread"""
+        if self._saving:
+            self.statusBar().showMessage("Save already in progress")
+            return
+        
+        # Update model with current tab states (touches widgets, so stays on the GUI thread)
         self._sync_model_from_tabs()
         
-        # Always save as JSON
-        STPAModelIO.save_json(self.model, path)
+        # Always save as JSON; the worker gets plain data so later edits can't race the writer
+        worker = _SaveWorker(STPAModelIO.snapshot(self.model), path)
+        worker.signals.finished.connect(self._on_save_finished)
+        worker.signals.error.connect(self._on_save_failed)
+        self._save_worker = worker
+        # Syncing above may itself report changes, so count only after it
+        self._save_target = (self.model, self._change_count)
+        self._saving = True
+        self.statusBar().showMessage(f"Saving model to {path}...")
+        QThreadPool.globalInstance().start(worker)
     
     def _load_model_from_path(self, path: str):
-        """Load model from path (JSON only)"""
-        # Always load as JSON
-        self.model = STPAModelIO.load_json(path)
+        """Load model from path (JSON only) on a background thread"""
+        if self._load_worker is not None:
+            self.statusBar().showMessage("Load already in progress")
+            return
         
-        # Update all tabs with the new model
-        self.control_structure_tab.set_model(self.model)
-        self.description_tab.set_model(self.model)
-        self.losses_hazards_tab.set_model(self.model)
-        self.uca_analysis_tab.set_model(self.model)
+        # Always load as JSON; the tabs are only touched once the model is ready
+        worker = _LoadWorker(path)
+        worker.signals.loaded.connect(self._on_load_finished)
+        worker.signals.failed.connect(self._on_load_failed)
+        self._load_worker = worker
+        
+        # Busy indicator; stays hidden for loads that finish quickly
+        progress = QProgressDialog("Loading model...", "Cancel", 0, 0, self)
+        progress.setWindowTitle("Load Model")
+        progress.setWindowModality(Qt.WindowModal)
+        progress.setMinimumDuration(300)
+        progress.canceled.connect(self._on_load_canceled)
+        self._load_progress = progress
+        
+        self.statusBar().showMessage(f"Loading model from {path}...")
+        QThreadPool.globalInstance().start(worker)
+    
+    def _end_load(self):
+        """Forget the running load and dismiss its progress dialog"""
+        self._load_worker = None
+        if self._load_progress is not None:
+            self._load_progress.canceled.disconnect(self._on_load_canceled)
+            self._load_progress.reset()
+            self._load_progress.deleteLater()
+            self._load_progress = None
+    
+    def _is_current_load(self) -> bool:
+        """Whether the emitting load worker is the one still awaited"""
+        return self._load_worker is not None and self.sender() is self._load_worker.signals
+    
+    @Slot(str, object)
+    def _on_load_finished(self, path: str, model: STPAModel):
+        """Install a model loaded in the background"""
+        if not self._is_current_load():
+            return  # canceled
+        self._end_load()
+        
+        self._install_model(model)
+        self._current_file_path = path
+        self._current_file_format = "json"
+        self._has_unsaved_changes = False
+        
+        self._update_window_title()
+        self.statusBar().showMessage(f"Model loaded from {path}")
+    
+    @Slot(str, object)
+    def _on_load_failed(self, path: str, error: Exception):
+        """Report a failed background load"""
+        if not self._is_current_load():
+            return  # canceled
+        self._end_load()
+        
+        if isinstance(error, FileNotFoundError):
+            error_msg = f"File not found: {path}"
+            status = "Load failed - file not found"
+        elif isinstance(error, ValueError):
+            error_msg = f"Invalid file format: {str(error)}"
+            status = "Load failed - invalid format"
+        else:
+            error_msg = f"Could not load model: {str(error)}"
+            status = "Load failed"
+        QMessageBox.critical(self, "Load Failed", error_msg)
+        self.statusBar().showMessage(status)
+    
+    @Slot()
+    def _on_load_canceled(self):
+        """Drop the running load; its result is ignored when it arrives"""
+        self._end_load()
+        self.statusBar().showMessage("Load canceled")
+    
+    def _install_model(self, model: STPAModel):
+        """Make model the current model and hand it to every tab"""
+        self.model.remove_change_listener(self._on_model_changed)
+        self.model = model
+        
+        with self._frozen_ui():
+            self.control_structure_tab.set_model(self.model)
+            self.description_tab.set_model(self.model)
+            self.losses_hazards_tab.set_model(self.model)
+            self.uca_analysis_tab.set_model(self.model)
+        
+        # Subscribe only now, so filling the tabs' widgets doesn't count as an edit;
+        # the tabs mirror the new model, so none has anything to sync back yet
+        self._dirty_tabs.clear()
+        self.model.add_change_listener(self._on_model_changed)
+    
+    @contextmanager
+    def _frozen_ui(self) -> Iterator[None]:
+        """Suspend repaints and tab signals while several tabs are updated at once"""
+        self.setUpdatesEnabled(False)
+        self.tabs.blockSignals(True)
+        try:
+            yield
+        finally:
+            self.tabs.blockSignals(False)
+            self.setUpdatesEnabled(True)
+            self.update()
     
     def _sync_model_from_tabs(self):
-        """Update the model with current state from all tabs"""
-        # Each tab will update its portion of the model
-        self.control_structure_tab.sync_to_model()
-        self.description_tab.sync_to_model()
-        self.losses_hazards_tab.sync_to_model()
-        self.uca_analysis_tab.sync_to_model()
+        """Update the model with current state from the tabs edited since the last sync"""
+        # Property edits still waiting on the debounce timers haven't marked
+        # their tab dirty yet; apply them first so the sync below sees them
+        self.control_structure_tab.properties_panel.flush_pending_edits()
+        
+        # Each tab updates its own portion of the model; syncing may report
+        # changes again, which the clear below discards
+        for name in tuple(self._dirty_tabs):
+            self._tab_instances[name].sync_to_model()
+        self._dirty_tabs.clear()
+        
+        # Chat transcripts reach the model on a timer; store any still pending
+        for tab in self._tab_instances.values():
+            tab.chat_panel.flush_transcript()
     
+    @Slot()
     def _update_window_title(self):
         """Update window title with current model name and file"""
         title = f"Eir v{VERSION} - {self.model.name}"
@@ -384,7 +601,9 @@ class STPAMainWindow(QMainWindow):
             title += f" [{Path(self._current_file_path).name}]"
         if self._has_unsaved_changes:
             title += " *"
-        self.setWindowTitle(title)
+        if title != self._last_title:
+            self._last_title = title
+            self.setWindowTitle(title)
     
     def _confirm_unsaved_changes(self) -> bool:
         """Ask user about unsaved changes. Returns True if it's OK to proceed."""
@@ -398,6 +617,7 @@ class STPAMainWindow(QMainWindow):
         )
         return reply == QMessageBox.Yes
     
+    @Slot()
     def show_about(self):
         """Show the About dialog"""
         QMessageBox.about(
@@ -420,17 +640,19 @@ class STPAMainWindow(QMainWindow):
             """
         )
     
+    @Slot()
     def show_help_panel(self):
         """Show the help panel"""
         if self.help_panel.isVisible():
             self.help_panel.hide()
         else:
-            self.help_panel.show()
-            self._update_contextual_help()
+            self.help_panel.show()  # refreshed from visibilityChanged
     
+    @Slot(int)
     def _on_tab_changed(self, index: int):
         """Handle tab change to update contextual help"""
-        self._update_contextual_help()
+        if self.help_panel.isVisible():
+            self._help_refresh_timer.start()
         
         # Set focus to the current tab to ensure it receives key events
         current_widget = self.tabs.currentWidget()
@@ -438,36 +660,45 @@ class STPAMainWindow(QMainWindow):
             current_widget.setFocus(Qt.TabFocusReason)
     
     def keyPressEvent(self, event):
-        """Forward key events to the current tab if it can handle them"""
+        """Hand keys pressed outside the current tab (toolbar, help dock) to that tab"""
+        # Keys from inside the tab already went through its own keyPressEvent
         current_widget = self.tabs.currentWidget()
-        
-        # Check if current tab has its own keyPressEvent
-        if current_widget and hasattr(current_widget, 'keyPressEvent'):
+        focus = QApplication.focusWidget()
+        if current_widget is not None and not (focus is not None and current_widget.isAncestorOf(focus)):
             current_widget.keyPressEvent(event)
-            return
-            
-        super().keyPressEvent(event)
+        else:
+            super().keyPressEvent(event)
     
+    @Slot()
     def _update_contextual_help(self):
         """Update help panel with context-sensitive content"""
         if not self.help_panel.isVisible():
             return
         
         current_index = self.tabs.currentIndex()
-        tab_contexts = {
-            0: "control_structure",
-            1: "system_description",  # System Description
-            2: "stpa_methodology",  # Losses & Hazards
-            3: "uca_analysis",  # UCA Analysis
-            4: "stpa_methodology"   # Scenarios (future)
-        }
-        
-        context = tab_contexts.get(current_index, "getting_started")
+        if 0 <= current_index < len(self._TAB_CONTEXTS):
+            context = self._TAB_CONTEXTS[current_index]
+        else:
+            context = "getting_started"
+        if context == self._last_help_context:
+            return
+        self._last_help_context = context
         self.help_panel.show_contextual_help(context)
     
+    @Slot(bool)
+    def _on_help_visibility_changed(self, visible: bool):
+        """Refresh help when the panel is shown, forget its context when hidden"""
+        if visible:
+            self._update_contextual_help()
+        else:
+            self._last_help_context = None
+    
     def closeEvent(self, event):
         """Handle window close event"""
         if self._confirm_unsaved_changes():
+            if self._saving:
+                # Let an in-flight save reach the disk before the window goes away
+                QThreadPool.globalInstance().waitForDone()
             event.accept()
         else:
             event.ignore()
@@ -2,51 +2,143 @@
 Shared UI components.
 """
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable, List, Set, Tuple
+import asyncio
 import json
 import random
+import threading
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QTextEdit,
     QComboBox, QPushButton, QFormLayout, QGroupBox, QPlainTextEdit,
     QScrollArea, QFrame
 )
-from PySide6.QtCore import Qt, Signal, QTimer, QThread
-from PySide6.QtGui import QFont, QTextCursor, QColor
+from PySide6.QtCore import Qt, Signal, QTimer, QCoreApplication, QStringListModel
+from PySide6.QtGui import QFont, QTextCursor, QTextDocument, QColor
 
 from core.models import STPAModel
 from core.ai_integration import get_ai_manager
 
 
-class AIResponseWorker(QThread):
-    """Worker thread for generating AI responses without blocking UI"""
-    response_ready = Signal(str)
+# Lines closing system and assistant messages in the chat
+_SYS_SEP = "-" * 50 + "\n"
+_ASSIST_SEP = "-" * 30 + "\n"
+
+# One long-lived event loop, on a daemon thread, runs every chat's AI requests
+_ai_loop: Optional[asyncio.AbstractEventLoop] = None
+_ai_loop_lock = threading.Lock()
+
+
+def _get_ai_loop() -> asyncio.AbstractEventLoop:
+    """Start the AI request loop on first use and return it"""
+    global _ai_loop
+    with _ai_loop_lock:
+        if _ai_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="ai-requests", daemon=True).start()
+            _ai_loop = loop
+    return _ai_loop
+
+
+class PendingRequestQueue:
+    """Collects AI requests that arrive close together and runs them with one gather()
     
-    def __init__(self, user_input: str, context: Optional[Dict[str, Any]] = None):
-        super().__init__()
-        self.user_input = user_input
-        self.context = context
-        
-    def run(self):
-        """Generate AI response in background thread"""
+    Requests from several chat panels overlap on the network instead of queueing
+    behind each other. Ollama only serves them in parallel up to its
+    OLLAMA_NUM_PARALLEL setting (server side); raise it to benefit from larger batches.
+    """
+    
+    BATCH_WINDOW = 0.010  # seconds to wait for more requests before dispatching
+    
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self._loop = loop
+        self._pending: List[Tuple[str, Optional[Dict[str, Any]], Callable[[str], None], Callable[[], None]]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        # The loop only keeps weak references to tasks; hold them until they finish
+        self._tasks: Set[asyncio.Task] = set()
+    
+    def submit(self, user_input: str, context: Optional[Dict[str, Any]],
+               on_chunk: Callable[[str], None], on_done: Callable[[], None]):
+        """Queue a request from any thread; the callbacks are called on the AI loop"""
+        self._loop.call_soon_threadsafe(self._enqueue, user_input, context, on_chunk, on_done)
+    
+    def _enqueue(self, user_input: str, context: Optional[Dict[str, Any]],
+                 on_chunk: Callable[[str], None], on_done: Callable[[], None]):
+        """Add a request to the current batch, opening a batch window if needed"""
+        self._pending.append((user_input, context, on_chunk, on_done))
+        if self._flush_handle is None:
+            self._flush_handle = self._loop.call_later(self.BATCH_WINDOW, self._flush)
+    
+    def _flush(self):
+        """Dispatch everything collected during the batch window"""
+        batch, self._pending = self._pending, []
+        self._flush_handle = None
+        task = self._loop.create_task(self._run_batch(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+    
+    @staticmethod
+    def _error_reply(error: Exception) -> str:
+        """Text shown in the console when a request fails"""
+        return f"I apologize, but I encountered an error: {str(error)}\n\nI'm still here to help with STPA methodology questions!"
+    
+    async def _run_batch(self, batch):
+        """Run a batch of requests concurrently"""
         try:
             ai_manager = get_ai_manager()
-            response = ai_manager.generate_response(self.user_input, self.context)
-            self.response_ready.emit(response)
         except Exception as e:
-            error_response = f"I apologize, but I encountered an error: {str(e)}\n\nI'm still here to help with STPA methodology questions!"
-            self.response_ready.emit(error_response)
+            # Finish every request so no console is left waiting
+            for _, _, on_chunk, on_done in batch:
+                try:
+                    on_chunk(self._error_reply(e))
+                finally:
+                    on_done()
+            return
+        await asyncio.gather(*(self._stream(ai_manager, *request) for request in batch))
+    
+    async def _stream(self, ai_manager, user_input: str, context: Optional[Dict[str, Any]],
+                      on_chunk: Callable[[str], None], on_done: Callable[[], None]):
+        """Relay one response to its console as the pieces arrive"""
+        try:
+            async for chunk in ai_manager.astream_response(user_input, context):
+                on_chunk(chunk)
+        except Exception as e:
+            on_chunk(self._error_reply(e))
+        finally:
+            on_done()
+
+
+_request_queue: Optional[PendingRequestQueue] = None
+
+
+def _get_request_queue() -> PendingRequestQueue:
+    """Return the shared AI request queue, creating it on first use"""
+    global _request_queue
+    loop = _get_ai_loop()
+    with _ai_loop_lock:
+        if _request_queue is None:
+            _request_queue = PendingRequestQueue(loop)
+    return _request_queue
 
 
 class ChatConsole(QPlainTextEdit):
     """Chat console with input/output merged for AI interaction"""
     
+    transcript_changed = Signal()  # a user or assistant message was added
+    # Emitted from the AI loop thread, delivered queued
+    _response_chunk = Signal(str)
+    _response_finished = Signal()
+    
+    LOAD_CHUNK_LINES = 100  # transcript lines added per step when restoring a long chat
+    WELCOME_MESSAGE = "STPA Assistant: Hello! I'm here to help with your STPA analysis. Ask me about:\n• Control structure design\n• Identifying losses and hazards\n• STPA methodology\n• Safety analysis techniques\n\nType your questions below and press Ctrl+Enter, Shift+Enter, or Cmd+Enter to send."
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         
         # AI integration
         self.context_provider = None  # Will be set by parent tab
-        self.ai_worker = None
+        self._response_chunk.connect(self._append_to_assistant_message)
+        self._response_finished.connect(self._on_ai_response_finished)
         
         # Setup appearance
         self.setStyleSheet("""
@@ -67,12 +159,28 @@ class ChatConsole(QPlainTextEdit):
         self.transcript = ""
         self.input_start_pos = 0
         self.waiting_for_response = False
+        self._assistant_message_open = False
+        
+        # Messages are appended through one cursor that stays at the end of the document
+        self._end_cursor = QTextCursor(self.document())
+        self._end_cursor.movePosition(QTextCursor.End)
+        
+        # Long transcripts are restored a chunk per event loop pass
+        self._load_lines: List[str] = []
+        self._load_pos = 0
+        self._load_undo_enabled = False
+        self._load_timer = QTimer(self)
+        self._load_timer.setInterval(0)
+        self._load_timer.timeout.connect(self._load_next_chunk)
         
         # Initialize with welcome message
-        self._add_system_message("STPA Assistant: Hello! I'm here to help with your STPA analysis. Ask me about:\n• Control structure design\n• Identifying losses and hazards\n• STPA methodology\n• Safety analysis techniques\n\nType your questions below and press Ctrl+Enter, Shift+Enter, or Cmd+Enter to send.")
+        self._add_system_message(self.WELCOME_MESSAGE)
     
     def keyPressEvent(self, event):
         """Handle key press events for chat input"""
+        # Typing goes after the whole restored transcript
+        self._finish_loading()
+        
         # Handle Ctrl+Enter, Shift+Enter, or Cmd+Enter for sending
         if (event.key() == Qt.Key_Return and 
             (event.modifiers() == Qt.ControlModifier or 
@@ -93,38 +201,54 @@ class ChatConsole(QPlainTextEdit):
     
     def _add_system_message(self, message: str):
         """Add a system message to the chat"""
-        cursor = self.textCursor()
-        cursor.movePosition(QTextCursor.End)
-        
-        if self.toPlainText():
-            cursor.insertText("\n\n")
+        self._finish_loading()
+        if self.document().characterCount() > 1:
+            self._end_cursor.insertText("\n\n")
         
         # Format system message
-        cursor.insertText(f"{message}\n")
-        cursor.insertText("-" * 50 + "\n")
+        self._end_cursor.insertText(f"{message}\n")
+        self._end_cursor.insertText(_SYS_SEP)
         
         self._update_input_position()
         self.ensureCursorVisible()
     
     def _add_user_message(self, message: str):
         """Add a user message to the chat"""
-        cursor = self.textCursor()
-        cursor.movePosition(QTextCursor.End)
-        cursor.insertText(f"\nUser: {message}\n")
+        self._finish_loading()
+        self._end_cursor.insertText(f"\nUser: {message}\n")
         self._update_input_position()
+        self.transcript_changed.emit()
     
-    def _add_assistant_message(self, message: str):
-        """Add an assistant response to the chat"""
-        cursor = self.textCursor()
-        cursor.movePosition(QTextCursor.End)
-        cursor.insertText(f"\nAssistant: {message}\n")
-        cursor.insertText("-" * 30 + "\n")
+    def _append_to_assistant_message(self, chunk: str):
+        """Add a streamed piece of the assistant response to the chat"""
+        # A restore in progress must not have the response spliced into it
+        self._finish_loading()
+        if not self._assistant_message_open:
+            chunk = chunk.lstrip()
+            if not chunk:
+                return
+        
+        if not self._assistant_message_open:
+            self._end_cursor.insertText("\nAssistant: ")
+            self._assistant_message_open = True
+        self._end_cursor.insertText(chunk)
+        self.ensureCursorVisible()
+    
+    def _close_assistant_message(self):
+        """End the assistant response with its separator line"""
+        self._finish_loading()
+        if not self._assistant_message_open:
+            self._end_cursor.insertText("\nAssistant: ")
+        self._end_cursor.insertText("\n" + _ASSIST_SEP)
+        self._assistant_message_open = False
         self._update_input_position()
         self.ensureCursorVisible()
+        self.transcript_changed.emit()
     
     def _update_input_position(self):
         """Update the position where new input should start"""
-        self.input_start_pos = len(self.toPlainText())
+        # characterCount() includes the trailing paragraph separator
+        self.input_start_pos = self.document().characterCount() - 1
     
     def _send_message(self):
         """Send the current message"""
@@ -132,11 +256,15 @@ class ChatConsole(QPlainTextEdit):
             return
         
         # Get the input text (everything after input_start_pos)
-        full_text = self.toPlainText()
-        if len(full_text) <= self.input_start_pos:
+        end_pos = self.document().characterCount() - 1
+        if end_pos <= self.input_start_pos:
             return
         
-        user_input = full_text[self.input_start_pos:].strip()
+        cursor = QTextCursor(self.document())
+        cursor.setPosition(self.input_start_pos)
+        cursor.setPosition(end_pos, QTextCursor.KeepAnchor)
+        # selectedText() marks line breaks with U+2029
+        user_input = cursor.selectedText().replace("\u2029", "\n").strip()
         if not user_input:
             return
         
@@ -154,10 +282,22 @@ class ChatConsole(QPlainTextEdit):
         # Get context from parent tab if available
         context = self._get_current_context()
         
-        # Start AI worker thread
-        self.ai_worker = AIResponseWorker(user_input, context)
-        self.ai_worker.response_ready.connect(self._on_ai_response_ready)
-        self.ai_worker.start()
+        # Queue the request; it is batched with any others sent at the same moment
+        _get_request_queue().submit(user_input, context, self._deliver_chunk, self._deliver_finished)
+    
+    def _deliver_chunk(self, chunk: str):
+        """Hand a response piece from the AI loop thread to the GUI thread"""
+        try:
+            self._response_chunk.emit(chunk)
+        except RuntimeError:
+            pass  # console was destroyed while the request was running
+    
+    def _deliver_finished(self):
+        """Tell the GUI thread the response is complete"""
+        try:
+            self._response_finished.emit()
+        except RuntimeError:
+            pass
     
     def _get_current_context(self) -> Optional[Dict[str, Any]]:
         """Get current context from parent tab"""
@@ -170,15 +310,10 @@ class ChatConsole(QPlainTextEdit):
             print(f"Error getting context: {e}")
             return None
     
-    def _on_ai_response_ready(self, response: str):
-        """Handle AI response when ready"""
-        self._add_assistant_message(response)
+    def _on_ai_response_finished(self):
+        """Handle the end of a streamed AI response"""
+        self._close_assistant_message()
         self.waiting_for_response = False
-        
-        # Clean up worker
-        if self.ai_worker:
-            self.ai_worker.deleteLater()
-            self.ai_worker = None
     
     def set_context_provider(self, provider_func):
         """Set function to provide context information to AI"""
@@ -186,31 +321,226 @@ class ChatConsole(QPlainTextEdit):
     
     def get_transcript(self) -> str:
         """Get the full chat transcript"""
+        self._finish_loading()
         return self.toPlainText()
     
+    def reset(self):
+        """Clear the chat back to the welcome message"""
+        self._cancel_loading()
+        self.clear()
+        self._assistant_message_open = False
+        self._end_cursor.movePosition(QTextCursor.End)
+        self._add_system_message(self.WELCOME_MESSAGE)
+    
     def set_transcript(self, transcript: str):
         """Set the chat transcript"""
-        self.setPlainText(transcript)
+        self._cancel_loading()
+        lines = transcript.split("\n")
+        if self.maximumBlockCount() > 0:
+            # Older lines would be trimmed as soon as they were added
+            lines = lines[-self.maximumBlockCount():]
+        
+        if len(lines) <= self.LOAD_CHUNK_LINES:
+            self.setPlainText("\n".join(lines))
+            self._on_transcript_loaded()
+        else:
+            # Load long histories a chunk at a time from the event loop so the
+            # window keeps repainting, without running a nested event loop
+            self._load_undo_enabled = self.document().isUndoRedoEnabled()
+            self.document().setUndoRedoEnabled(False)
+            self.clear()
+            self._load_lines = lines
+            self._load_pos = 0
+            self._load_timer.start()
+    
+    def _load_next_chunk(self):
+        """Add the next chunk of a transcript being restored"""
+        start = self._load_pos
+        self._load_pos += self.LOAD_CHUNK_LINES
+        self.appendPlainText("\n".join(self._load_lines[start:self._load_pos]))
+        if self._load_pos >= len(self._load_lines):
+            self._end_loading()
+    
+    def _finish_loading(self):
+        """Add the rest of a transcript being restored right away"""
+        if self._load_timer.isActive():
+            self.appendPlainText("\n".join(self._load_lines[self._load_pos:]))
+            self._end_loading()
+    
+    def _cancel_loading(self):
+        """Stop restoring a transcript that is about to be replaced"""
+        if self._load_timer.isActive():
+            self._load_timer.stop()
+            self._load_lines = []
+            self.document().setUndoRedoEnabled(self._load_undo_enabled)
+    
+    def _end_loading(self):
+        """Wrap up a chunked transcript restore"""
+        self._load_timer.stop()
+        self._load_lines = []
+        self.document().setUndoRedoEnabled(self._load_undo_enabled)
+        self._on_transcript_loaded()
+    
+    def _on_transcript_loaded(self):
+        """Put the input position and cursor after a restored transcript"""
+        self._end_cursor.movePosition(QTextCursor.End)
         self._update_input_position()
         cursor = self.textCursor()
         cursor.movePosition(QTextCursor.End)
         self.setTextCursor(cursor)
 
 
+class _DescEditor(QWidget):
+    """Description editor: a line edit for short text, a text edit once it spans lines"""
+    
+    textChanged = Signal()
+    
+    SHORT_TEXT_LIMIT = 120
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        
+        self._layout = QVBoxLayout(self)
+        self._layout.setContentsMargins(0, 0, 0, 0)
+        self._line_edit: Optional[QLineEdit] = None
+        self._text_edit: Optional[QTextEdit] = None
+        self._multiline = False
+    
+    def _get_line_edit(self) -> QLineEdit:
+        """Return the single-line editor, creating it on first use"""
+        if self._line_edit is None:
+            self._line_edit = QLineEdit()
+            self._line_edit.editingFinished.connect(self.textChanged)
+            # Return starts a second line, so switch to the multi-line editor
+            self._line_edit.returnPressed.connect(self._upgrade)
+            self._layout.addWidget(self._line_edit)
+        return self._line_edit
+    
+    def _get_text_edit(self) -> QTextEdit:
+        """Return the multi-line editor, creating it on first use"""
+        if self._text_edit is None:
+            self._text_edit = QTextEdit()
+            self._text_edit.setMaximumHeight(80)
+            self._text_edit.textChanged.connect(self.textChanged)
+            self._layout.addWidget(self._text_edit)
+        return self._text_edit
+    
+    def _use_multiline(self, multiline: bool):
+        """Show the editor for the chosen mode and hide the other"""
+        self._multiline = multiline
+        if self._line_edit is not None:
+            self._line_edit.setVisible(not multiline)
+        if self._text_edit is not None:
+            self._text_edit.setVisible(multiline)
+    
+    def setPlainText(self, text: str):
+        """Show text in the editor that suits it, without reporting a change"""
+        if len(text) < self.SHORT_TEXT_LIMIT and '\n' not in text:
+            editor = self._get_line_edit()
+            editor.blockSignals(True)
+            if editor.text() != text:
+                editor.setText(text)
+            editor.blockSignals(False)
+            self._use_multiline(False)
+        else:
+            editor = self._get_text_edit()
+            editor.blockSignals(True)
+            editor.setPlainText(text)
+            editor.blockSignals(False)
+            self._use_multiline(True)
+    
+    def _upgrade(self):
+        """Switch from the line edit to the text edit and continue on a new line"""
+        text_edit = self._get_text_edit()
+        text_edit.blockSignals(True)
+        text_edit.setPlainText(self._line_edit.text() + '\n')
+        text_edit.blockSignals(False)
+        self._use_multiline(True)
+        text_edit.moveCursor(QTextCursor.End)
+        text_edit.setFocus()
+        self.textChanged.emit()
+    
+    def toPlainText(self) -> str:
+        """Return the description text"""
+        if self._multiline:
+            return self._text_edit.toPlainText()
+        return self._line_edit.text()
+
+
+class _ReadOnlyLabel(QLabel):
+    """Label for read-only values, styled by the properties pane's stylesheet"""
+    
+    def __init__(self, text: str = "", parent=None):
+        super().__init__(text, parent)
+        self.setObjectName("readonly")
+
+
+def _set_line_text(edit: QLineEdit, text: str):
+    """Set a pooled line edit's text without signals, skipping unchanged text"""
+    if edit.text() != text:
+        edit.blockSignals(True)
+        edit.setText(text)
+        edit.blockSignals(False)
+
+
+def _set_combo_text(combo: QComboBox, text: str):
+    """Select text in a pooled combo box without signals, falling back to the first entry"""
+    index = max(combo.findText(text), 0)
+    if combo.currentIndex() != index:
+        combo.blockSignals(True)
+        combo.setCurrentIndex(index)
+        combo.blockSignals(False)
+
+
 class PropertiesPane(QWidget):
     """Properties panel for editing selected items"""
     
     # Signals
-    property_changed = Signal(str, str, object)  # item_id, property_name, value
+    property_changed = Signal(str, str, object)  # item_id, property_name, value (deprecated: per edit)
+    properties_changed = Signal(str, dict)  # item_id, {property_name: value} once per editing burst
+    
+    EDIT_DEBOUNCE_MS = 150
+    
+    # Combo box choices; the item models are created once and shared by every pane
+    NODE_TYPES = ('controller', 'controlled_process', 'actuator', 'sensor', 'other')
+    NODE_SHAPES = ('circle', 'rectangle', 'hexagon')
+    LINK_TYPES = ('control_action', 'feedback', 'disturbance', 'information', 'other')
+    _combo_models: Dict[Tuple[str, ...], QStringListModel] = {}
     
     def __init__(self, parent=None):
         super().__init__(parent)
         
         self.current_item_id: Optional[str] = None
         self.current_item_type: Optional[str] = None  # 'node' or 'edge'
-        self.current_item_data: Optional[dict] = None
+        self.current_item_data: Optional[dict] = None  # shared with the caller, not copied
+        
+        # Typing in the multi-line editors is reported after a short pause
+        self._desc_edit: Optional[_DescEditor] = None
+        self._desc_timer = QTimer(self)
+        self._desc_timer.setSingleShot(True)
+        self._desc_timer.setInterval(self.EDIT_DEBOUNCE_MS)
+        self._desc_timer.timeout.connect(self._emit_description)
+        self._states_timer = QTimer(self)
+        self._states_timer.setSingleShot(True)
+        self._states_timer.setInterval(self.EDIT_DEBOUNCE_MS)
+        self._states_timer.timeout.connect(self._states_text_changed)
+        self._last_states: Optional[List[str]] = None
+        
+        # Edits not yet sent through properties_changed
+        self._unreported_changes: Dict[str, Any] = {}
+        self._report_timer = QTimer(self)
+        self._report_timer.setSingleShot(True)
+        self._report_timer.setInterval(self.EDIT_DEBOUNCE_MS)
+        self._report_timer.timeout.connect(self._report_changes)
         
         self._setup_ui()
+        self.setStyleSheet("QLabel#readonly { color: #6c757d; }")
+        
+        # The node and link forms are built once and refilled for each selection
+        self._current_form: Optional[QWidget] = None
+        self._node_form = self._build_node_form()
+        self._edge_form = self._build_edge_form()
+        
         self.clear_properties()
     
     def _setup_ui(self):
@@ -240,96 +570,60 @@ class PropertiesPane(QWidget):
         
         layout.addStretch()
     
-    def clear_properties(self):
-        """Clear all property editors"""
-        # Clear layout
-        for i in reversed(range(self.props_layout.count())):
-            item = self.props_layout.takeAt(i)
-            if item.widget():
-                item.widget().deleteLater()
-        
-        self.title.setText("Properties")
-        self.status_label.setText("Select an item to edit its properties")
-        self.current_item_id = None
-        self.current_item_type = None
-        self.current_item_data = None
+    @classmethod
+    def _combo_model(cls, choices: Tuple[str, ...]) -> QStringListModel:
+        """Return the shared item model listing choices"""
+        model = cls._combo_models.get(choices)
+        if model is None:
+            # Owned by the application so it outlives any single pane
+            model = QStringListModel(list(choices), QCoreApplication.instance())
+            cls._combo_models[choices] = model
+        return model
     
-    def show_node_properties(self, node_id: str, node_data: dict):
-        """Show properties for a node"""
-        self.current_item_id = node_id
-        self.current_item_type = 'node'
-        self.current_item_data = node_data.copy()
-        
-        self._clear_layout()
-        self.title.setText(f"Node Properties: {node_id}")
-        self.status_label.setText(f"Editing node: {node_id}")
-        
-        # Create property editors
+    def _build_node_form(self) -> QWidget:
+        """Create the node property editors"""
         form_layout = QFormLayout()
         
         # Name
-        name_edit = QLineEdit(node_data.get('name', ''))
-        name_edit.editingFinished.connect(lambda: self._property_changed('name', name_edit.text()))
-        form_layout.addRow("Name:", name_edit)
+        self._name_edit = QLineEdit()
+        self._name_edit.editingFinished.connect(lambda: self._property_changed('name', self._name_edit.text()))
+        form_layout.addRow("Name:", self._name_edit)
         
         # Node Type
-        type_combo = QComboBox()
-        type_combo.addItems(['controller', 'controlled_process', 'actuator', 'sensor', 'other'])
-        current_type = node_data.get('node_type', 'other')
-        index = type_combo.findText(current_type)
-        if index >= 0:
-            type_combo.setCurrentIndex(index)
-        type_combo.currentTextChanged.connect(lambda text: self._property_changed('node_type', text))
-        form_layout.addRow("Type:", type_combo)
+        self._node_type_combo = QComboBox()
+        self._node_type_combo.setModel(self._combo_model(self.NODE_TYPES))
+        self._node_type_combo.currentTextChanged.connect(lambda text: self._property_changed('node_type', text))
+        form_layout.addRow("Type:", self._node_type_combo)
         
         # Shape selector
-        shape_combo = QComboBox()
-        shape_combo.addItems(['circle', 'rectangle', 'hexagon'])
-        current_shape = node_data.get('shape', 'circle')
-        index = shape_combo.findText(current_shape)
-        if index >= 0:
-            shape_combo.setCurrentIndex(index)
-        shape_combo.currentTextChanged.connect(lambda text: self._property_changed('shape', text))
-        form_layout.addRow("Shape:", shape_combo)
+        self._shape_combo = QComboBox()
+        self._shape_combo.setModel(self._combo_model(self.NODE_SHAPES))
+        self._shape_combo.currentTextChanged.connect(lambda text: self._property_changed('shape', text))
+        form_layout.addRow("Shape:", self._shape_combo)
         
         # Size selector
-        size_edit = QLineEdit(str(node_data.get('size', 24.0)))
-        size_edit.editingFinished.connect(lambda: self._property_changed('size', size_edit.text()))
-        form_layout.addRow("Size:", size_edit)
+        self._size_edit = QLineEdit()
+        self._size_edit.editingFinished.connect(lambda: self._property_changed('size', self._size_edit.text()))
+        form_layout.addRow("Size:", self._size_edit)
         
         # Description
-        desc_edit = QTextEdit()
-        desc_edit.setPlainText(node_data.get('description', ''))
-        desc_edit.setMaximumHeight(80)
-        desc_edit.textChanged.connect(lambda: self._property_changed('description', desc_edit.toPlainText()))
-        form_layout.addRow("Description:", desc_edit)
+        self._node_desc_edit = _DescEditor()
+        self._node_desc_edit.textChanged.connect(self._desc_timer.start)
+        form_layout.addRow("Description:", self._node_desc_edit)
         
         # Position (read-only)
-        position = node_data.get('position', (0, 0))
-        pos_label = QLabel(f"({position[0]:.1f}, {position[1]:.1f})")
-        pos_label.setStyleSheet("color: #6c757d;")
-        form_layout.addRow("Position:", pos_label)
+        self._pos_label = _ReadOnlyLabel()
+        form_layout.addRow("Position:", self._pos_label)
         
         # State Machine section
         states_group = QGroupBox("State Machine")
         states_layout = QVBoxLayout(states_group)
         
         # States list
-        states = node_data.get('states', [])
         self.states_edit = QTextEdit()
-        if isinstance(states, list) and len(states) > 0:
-            if isinstance(states[0], str):
-                # Simple string list
-                states_text = '\n'.join([f"- {state}" for state in states])
-            else:
-                # Dictionary list with names and descriptions
-                states_text = '\n'.join([f"- {state.get('name', '')}: {state.get('description', '')}" for state in states])
-        else:
-            states_text = ""
-        self.states_edit.setPlainText(states_text)
         self.states_edit.setMaximumHeight(100)
         self.states_edit.setPlaceholderText("No states defined yet...\nClick 'Edit States' to add states.")
-        self.states_edit.textChanged.connect(lambda: self._states_text_changed())
+        self.states_edit.textChanged.connect(self._states_timer.start)
         states_layout.addWidget(QLabel("Current States:"))
         states_layout.addWidget(self.states_edit)
         
@@ -340,89 +634,195 @@ class PropertiesPane(QWidget):
         
         form_layout.addRow(states_group)
         
-        # Add form to layout
         form_widget = QWidget()
         form_widget.setLayout(form_layout)
-        self.props_layout.addWidget(form_widget)
+        return form_widget
     
-    def show_edge_properties(self, edge_id: str, edge_data: dict):
-        """Show properties for an edge"""
-        self.current_item_id = edge_id
-        self.current_item_type = 'edge'
-        self.current_item_data = edge_data.copy()
-        
-        self._clear_layout()
-        self.title.setText(f"Link Properties: {edge_id}")
-        self.status_label.setText(f"Editing link: {edge_id}")
-        
-        # Create property editors
+    def _build_edge_form(self) -> QWidget:
+        """Create the link property editors"""
         form_layout = QFormLayout()
         
         # Label
-        label_edit = QLineEdit(edge_data.get('label', ''))
-        label_edit.editingFinished.connect(lambda: self._property_changed('label', label_edit.text()))
-        form_layout.addRow("Label:", label_edit)
+        self._label_edit = QLineEdit()
+        self._label_edit.editingFinished.connect(lambda: self._property_changed('label', self._label_edit.text()))
+        form_layout.addRow("Label:", self._label_edit)
         
         # Link Type
-        type_combo = QComboBox()
-        type_combo.addItems(['control_action', 'feedback', 'disturbance', 'information', 'other'])
-        current_type = edge_data.get('link_type', 'control_action')
-        index = type_combo.findText(current_type)
-        if index >= 0:
-            type_combo.setCurrentIndex(index)
-        type_combo.currentTextChanged.connect(lambda text: self._property_changed('link_type', text))
-        form_layout.addRow("Type:", type_combo)
+        self._link_type_combo = QComboBox()
+        self._link_type_combo.setModel(self._combo_model(self.LINK_TYPES))
+        self._link_type_combo.currentTextChanged.connect(lambda text: self._property_changed('link_type', text))
+        form_layout.addRow("Type:", self._link_type_combo)
         
         # Description
-        desc_edit = QTextEdit()
-        desc_edit.setPlainText(edge_data.get('description', ''))
-        desc_edit.setMaximumHeight(80)
-        desc_edit.textChanged.connect(lambda: self._property_changed('description', desc_edit.toPlainText()))
-        form_layout.addRow("Description:", desc_edit)
+        self._edge_desc_edit = _DescEditor()
+        self._edge_desc_edit.textChanged.connect(self._desc_timer.start)
+        form_layout.addRow("Description:", self._edge_desc_edit)
         
         # Source and Target (read-only)
-        source_label = QLabel(edge_data.get('source_id', 'Unknown'))
-        source_label.setStyleSheet("color: #6c757d;")
-        form_layout.addRow("Source:", source_label)
+        self._source_label = _ReadOnlyLabel()
+        form_layout.addRow("Source:", self._source_label)
         
-        target_label = QLabel(edge_data.get('target_id', 'Unknown'))
-        target_label.setStyleSheet("color: #6c757d;")
-        form_layout.addRow("Target:", target_label)
+        self._target_label = _ReadOnlyLabel()
+        form_layout.addRow("Target:", self._target_label)
         
-        # Add form to layout
         form_widget = QWidget()
         form_widget.setLayout(form_layout)
-        self.props_layout.addWidget(form_widget)
+        return form_widget
+    
+    def _detach_current_form(self):
+        """Take the shown form out of the properties area, keeping it for reuse"""
+        if self._current_form is not None:
+            self.props_layout.removeWidget(self._current_form)
+            # Hide explicitly so a show queued by addWidget can't pop it up as a window
+            self._current_form.hide()
+            self._current_form.setParent(None)
+            self._current_form = None
+    
+    def _show_form(self, form: QWidget):
+        """Put form in the properties area in place of the one shown before"""
+        if form is self._current_form:
+            return
+        self._detach_current_form()
+        self._current_form = form
+        self.props_layout.addWidget(form)
+        form.show()
+    
+    def clear_properties(self):
+        """Clear all property editors"""
+        self.flush_pending_edits()
+        self._desc_edit = None
+        self._detach_current_form()
+        
+        self.title.setText("Properties")
+        self.status_label.setText("Select an item to edit its properties")
+        self.current_item_id = None
+        self.current_item_type = None
+        self.current_item_data = None
     
-    def _clear_layout(self):
-        """Clear the properties layout"""
-        for i in reversed(range(self.props_layout.count())):
-            item = self.props_layout.takeAt(i)
-            if item.widget():
-                item.widget().deleteLater()
+    def show_node_properties(self, node_id: str, node_data: dict):
+        """Show properties for a node"""
+        self.flush_pending_edits()
+        self.current_item_id = node_id
+        self.current_item_type = 'node'
+        self.current_item_data = node_data
+        
+        self.title.setText(f"Node Properties: {node_id}")
+        self.status_label.setText(f"Editing node: {node_id}")
+        
+        # Fill the pooled editors
+        _set_line_text(self._name_edit, node_data.get('name', ''))
+        _set_combo_text(self._node_type_combo, node_data.get('node_type', 'other'))
+        _set_combo_text(self._shape_combo, node_data.get('shape', 'circle'))
+        _set_line_text(self._size_edit, str(node_data.get('size', 24.0)))
+        self._node_desc_edit.setPlainText(node_data.get('description', ''))
+        self._desc_edit = self._node_desc_edit
+        
+        position = node_data.get('position', (0, 0))
+        self._pos_label.setText(f"({position[0]:.1f}, {position[1]:.1f})")
+        
+        # States list, preformatted by the caller when it can
+        states_text = node_data.get('_states_display')
+        if states_text is None:
+            states_text = self._format_states(node_data.get('states', []))
+        self.states_edit.blockSignals(True)
+        self.states_edit.setPlainText(states_text)
+        self.states_edit.blockSignals(False)
+        self._last_states = self._parse_states(self.states_edit.document())
+        
+        self._show_form(self._node_form)
+    
+    def show_edge_properties(self, edge_id: str, edge_data: dict):
+        """Show properties for an edge"""
+        self.flush_pending_edits()
+        self.current_item_id = edge_id
+        self.current_item_type = 'edge'
+        self.current_item_data = edge_data
+        
+        self.title.setText(f"Link Properties: {edge_id}")
+        self.status_label.setText(f"Editing link: {edge_id}")
+        
+        # Fill the pooled editors
+        _set_line_text(self._label_edit, edge_data.get('label', ''))
+        _set_combo_text(self._link_type_combo, edge_data.get('link_type', 'control_action'))
+        self._edge_desc_edit.setPlainText(edge_data.get('description', ''))
+        self._desc_edit = self._edge_desc_edit
+        
+        self._source_label.setText(edge_data.get('source_id', 'Unknown'))
+        self._target_label.setText(edge_data.get('target_id', 'Unknown'))
+        
+        self._show_form(self._edge_form)
     
     def _property_changed(self, property_name: str, value):
         """Handle property changes"""
         if self.current_item_id and self.current_item_data is not None:
-            self.current_item_data[property_name] = value
-            self.property_changed.emit(self.current_item_id, property_name, value)
+            self._queue_report(property_name, value)
+    
+    def _queue_report(self, property_name: str, value):
+        """Emit the per-edit signal and add the edit to the next batch"""
+        self.property_changed.emit(self.current_item_id, property_name, value)
+        self._unreported_changes[property_name] = value
+        self._report_timer.start()
+    
+    def _report_changes(self):
+        """Emit the edits collected since the last report as one properties_changed"""
+        self._report_timer.stop()
+        changes, self._unreported_changes = self._unreported_changes, {}
+        if changes and self.current_item_id:
+            self.properties_changed.emit(self.current_item_id, changes)
+    
+    def flush_pending_edits(self):
+        """Report text edits still waiting for the debounce timers"""
+        if self._desc_timer.isActive():
+            self._desc_timer.stop()
+            self._emit_description()
+        if self._states_timer.isActive():
+            self._states_timer.stop()
+            self._states_text_changed()
+        self._report_changes()
+    
+    def _emit_description(self):
+        """Report the description once typing pauses"""
+        if self._desc_edit is not None:
+            self._property_changed('description', self._desc_edit.toPlainText())
+            # Typing was already debounced, so don't wait for the batch timer too
+            self._report_changes()
+    
+    @staticmethod
+    def _format_states(states) -> str:
+        """Format a states list as editable text, one "- state" per line"""
+        if isinstance(states, list) and len(states) > 0:
+            if isinstance(states[0], str):
+                # Simple string list
+                return '\n'.join([f"- {state}" for state in states])
+            if isinstance(states[0], dict):
+                # Dictionary list with names and descriptions
+                return '\n'.join([f"- {state.get('name', '')}: {state.get('description', '')}" for state in states])
+            # State objects, as loaded from a model file
+            return '\n'.join([f"- {getattr(state, 'name', '')}: {getattr(state, 'description', '')}" for state in states])
+        return ""
+    
+    @staticmethod
+    def _parse_states(document: QTextDocument) -> List[str]:
+        """Parse state names from the states text (simple format: "- state_name")"""
+        # Scan line by line instead of copying and splitting the whole text
+        states = []
+        block = document.firstBlock()
+        while block.isValid():
+            line = block.text().strip()
+            if line.startswith('- '):
+                states.append(line[2:].split(':', 1)[0].strip())
+            block = block.next()
+        return states
     
     def _states_text_changed(self):
         """Handle changes to the states text"""
-        if hasattr(self, 'states_edit') and self.current_item_id:
-            text = self.states_edit.toPlainText()
-            # Parse states from text (simple format: "- state_name")
-            states = []
-            for line in text.split('\n'):
-                line = line.strip()
-                if line.startswith('- '):
-                    state_name = line[2:].strip()
-                    if ':' in state_name:
-                        name, desc = state_name.split(':', 1)
-                        states.append(name.strip())
-                    else:
-                        states.append(state_name)
-            self._property_changed('states', states)
+        if self.current_item_type == 'node' and self.current_item_id:
+            states = self._parse_states(self.states_edit.document())
+            # Edits that don't change the parsed list (e.g. descriptions) aren't reported
+            if states != self._last_states:
+                self._last_states = states
+                self._property_changed('states', states)
+                self._report_changes()
     
     def _edit_states(self):
         """Open state machine editor (placeholder)"""
@@ -436,16 +836,37 @@ class PropertiesPane(QWidget):
 class TabChatPanel(QWidget):
     """Chat panel specifically designed for tabs with context awareness"""
     
+    TRANSCRIPT_SAVE_DELAY_MS = 500
+    
     def __init__(self, tab_name: str, model: STPAModel, parent=None):
         super().__init__(parent)
         
         self.tab_name = tab_name
         self.model = model
         
-        self._setup_ui()
+        # Context handed to the AI, rebuilt only after the model changes
+        self._context_cache: Optional[Dict[str, Any]] = None
+        self.model.add_change_listener(self._on_model_changed)
         
-        # Load chat transcript for this tab
-        self._load_chat_transcript()
+        # Copying the transcript into the model waits for a pause in the chat
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(self.TRANSCRIPT_SAVE_DELAY_MS)
+        self._save_timer.timeout.connect(self._save_chat_transcript)
+        
+        # The console is built when the panel is first shown
+        self.console: Optional[ChatConsole] = None
+    
+    def showEvent(self, event):
+        """Build the chat UI the first time the panel becomes visible"""
+        self._ensure_ui()
+        super().showEvent(event)
+    
+    def _ensure_ui(self):
+        """Build the chat UI and load this tab's transcript if not done yet"""
+        if self.console is None:
+            self._setup_ui()
+            self._load_chat_transcript()
     
     def _setup_ui(self):
         """Set up the chat panel UI"""
@@ -463,12 +884,43 @@ class TabChatPanel(QWidget):
         # Set up context provider for AI
         self.console.set_context_provider(self._get_tab_context)
         
-        # Connect to model changes to update context
-        if hasattr(self.console, 'property_changed'):
-            self.console.property_changed.connect(self._save_chat_transcript)
+        # Keep the model's copy of the transcript current as messages arrive
+        self.console.transcript_changed.connect(self._on_transcript_changed)
+    
+    def set_model(self, model: STPAModel):
+        """Switch to a new model and show its transcript"""
+        self.flush_transcript()
+        self.model.remove_change_listener(self._on_model_changed)
+        self.model = model
+        self.model.add_change_listener(self._on_model_changed)
+        self._context_cache = None
+        self._load_chat_transcript()
+    
+    def _on_model_changed(self, section: Optional[str] = None):
+        """Drop the cached context after any model edit"""
+        self._context_cache = None
     
     def _get_tab_context(self) -> Dict[str, Any]:
         """Provide context information for AI responses"""
+        if self._context_cache is None:
+            self._context_cache = self._build_model_context()
+        
+        # Copy so the selection never leaks into the cache
+        context = dict(self._context_cache)
+        
+        # Add selected items if parent has selection info
+        if hasattr(self.parent(), 'get_selected_items'):
+            try:
+                selected = self.parent().get_selected_items()
+                if selected:
+                    context["selected_items"] = selected
+            except:
+                pass
+                
+        return context
+    
+    def _build_model_context(self) -> Dict[str, Any]:
+        """Collect the model summary part of the AI context"""
         context = {
             "current_tab": self.tab_name,
             "model_info": {
@@ -483,31 +935,43 @@ class TabChatPanel(QWidget):
         if hasattr(self.model, 'name') and self.model.name:
             context["project_name"] = self.model.name
             
-        # Add selected items if parent has selection info
-        if hasattr(self.parent(), 'get_selected_items'):
-            try:
-                selected = self.parent().get_selected_items()
-                if selected:
-                    context["selected_items"] = selected
-            except:
-                pass
-                
         return context
     
     def _load_chat_transcript(self):
         """Load chat transcript for this tab from model"""
+        if self.console is None:
+            return  # loaded when the panel is first shown
         if hasattr(self.model, 'chat_transcripts') and self.tab_name in self.model.chat_transcripts:
             self.console.set_transcript(self.model.chat_transcripts[self.tab_name])
+        else:
+            # Nothing saved for this tab; don't keep the previous model's chat
+            self.console.reset()
     
     def _save_chat_transcript(self):
         """Save chat transcript to model"""
+        self._save_timer.stop()
+        if self.console is None:
+            return  # never shown, so the model's copy is current
         if hasattr(self.model, 'chat_transcripts'):
             self.model.chat_transcripts[self.tab_name] = self.console.get_transcript()
     
+    def _on_transcript_changed(self):
+        """Schedule storing the transcript and report the edit"""
+        self._save_timer.start()
+        self.model.notify_changed()
+    
+    def flush_transcript(self):
+        """Store a transcript change still waiting for the save timer"""
+        if self._save_timer.isActive():
+            self._save_chat_transcript()
+    
     def get_transcript(self) -> str:
         """Get the chat transcript"""
+        if self.console is None:
+            return getattr(self.model, 'chat_transcripts', {}).get(self.tab_name, "")
         return self.console.get_transcript()
     
     def set_transcript(self, transcript: str):
         """Set the chat transcript"""
+        self._ensure_ui()
         self.console.set_transcript(transcript)
@@ -2,20 +2,22 @@
 Unsafe Control Actions (UCA) Analysis Tab.
 """
 
+import sys
+import weakref
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Set
+from typing import List, Dict, Optional, Set, Tuple
 from enum import Enum
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QPushButton, QLabel, 
-    QTextEdit, QTableWidget, QTableWidgetItem, QHeaderView, QSplitter,
-    QComboBox, QGroupBox, QListWidget, QListWidgetItem, QTabWidget,
-    QScrollArea, QFrame, QCheckBox, QSpinBox, QMessageBox
+    QTextEdit, QTableView, QHeaderView, QSplitter,
+    QComboBox, QGroupBox, QListWidget, QListWidgetItem, QListView, QTabWidget,
+    QScrollArea, QFrame, QCheckBox, QSpinBox, QMessageBox, QStyledItemDelegate
 )
-from PySide6.QtCore import Qt, Signal, QTimer
-from PySide6.QtGui import QFont, QColor, QPalette
+from PySide6.QtCore import Qt, Signal, QTimer, QAbstractTableModel, QAbstractListModel, QModelIndex
+from PySide6.QtGui import QFont, QColor, QPalette, QBrush
 
-from core.models import STPAModel
+from core.models import STPAModel, UnsafeControlAction as ModelUCA, UCAContext as ModelUCAContext
 from ui.shared_components import TabChatPanel
 
 
@@ -27,7 +29,22 @@ class UCACategory(Enum):
     STOPPED_TOO_SOON_OR_TOO_LONG = "Stopped Too Soon/Applied Too Long"
 
 
-@dataclass
+# Slotted dataclasses need Python 3.10+
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Matrix rows cycle through the categories in declaration order
+_UCA_CATEGORIES: Tuple[UCACategory, ...] = tuple(UCACategory)
+_N_CATEGORIES = len(_UCA_CATEGORIES)
+_CATEGORY_LABELS = tuple(category.value for category in _UCA_CATEGORIES)
+
+# Typed cell text -> True (UCA), False (safe); anything else is unknown
+_CELL_STATE: Dict[str, bool] = {
+    'Y': True, 'YES': True, 'UCA': True, '1': True,
+    'N': False, 'NO': False, 'SAFE': False, '0': False, '': False,
+}
+
+
+@dataclass(**_SLOTS)
 class ControlAction:
     """Represents a control action extracted from the control structure."""
     id: str
@@ -40,7 +57,7 @@ class ControlAction:
         return f"{self.source_node} → {self.target_node}: {self.name}"
 
 
-@dataclass 
+@dataclass(**_SLOTS)
 class Context:
     """Represents an operational context or system state."""
     id: str
@@ -52,7 +69,7 @@ class Context:
         return self.name
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class UnsafeControlAction:
     """Represents an identified unsafe control action."""
     id: str
@@ -76,25 +93,38 @@ class UnsafeControlAction:
 class ControlActionExtractor:
     """Extracts control actions from the control structure graph."""
     
-    @staticmethod
-    def extract_from_model(model: STPAModel) -> List[ControlAction]:
+    # Last result per control structure, with the revision it was built from
+    _cache: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+    
+    @classmethod
+    def extract_from_model(cls, model: STPAModel) -> List[ControlAction]:
         """Extract control actions from the control structure."""
-        control_actions = []
-        
         # Get the NetworkX graph from the control structure
         G = model.control_structure  # ControlStructure IS the graph
         
+        # Reuse the previous extraction while the graph is unchanged
+        cached = cls._cache.get(G)
+        if cached is not None and cached[0] == G.revision:
+            return list(cached[1])
+        
+        # Look up each node name once rather than twice per edge
+        node_names = {n: d.get('name', f'n{n}') for n, d in G.nodes(data=True)}
+        
+        control_actions = []
+        
         for u, v, key, data in G.edges(keys=True, data=True):
             # Get node names
-            source_name = G.nodes[u].get('name', f'n{u}')
-            target_name = G.nodes[v].get('name', f'n{v}')
+            source_name = node_names[u]
+            target_name = node_names[v]
             
             # Create control action
-            ca_id = f"CA-{u}-{v}-{key}"
-            ca_name = data.get('name', f"{source_name}_to_{target_name}")
+            if 'name' in data:
+                ca_name = data['name']
+            else:
+                ca_name = f"{source_name}_to_{target_name}"
             
             control_action = ControlAction(
-                id=ca_id,
+                id=f"CA-{u}-{v}-{key}",
                 name=ca_name,
                 source_node=source_name,
                 target_node=target_name,
@@ -103,7 +133,8 @@ class ControlActionExtractor:
             
             control_actions.append(control_action)
         
-        return control_actions
+        cls._cache[G] = (G.revision, control_actions)
+        return list(control_actions)
 
 
 class ContextManager(QWidget):
@@ -114,6 +145,7 @@ class ContextManager(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.contexts: List[Context] = []
+        self._contexts_by_id: Dict[str, Context] = {}
         self._setup_ui()
         self._setup_default_contexts()
     
@@ -183,18 +215,28 @@ class ContextManager(QWidget):
         
         for context in default_contexts:
             self.contexts.append(context)
+            self._contexts_by_id[context.id] = context
         
         self._refresh_context_list()
     
     def _refresh_context_list(self):
         """Refresh the context list widget."""
-        self.context_list.clear()
-        
-        for context in self.contexts:
-            item = QListWidgetItem(f"{context.name}")
-            item.setData(Qt.UserRole, context.id)
-            item.setToolTip(context.description)
-            self.context_list.addItem(item)
+        self.context_list.setUpdatesEnabled(False)
+        self.context_list.blockSignals(True)
+        try:
+            self.context_list.clear()
+            for context in self.contexts:
+                self._add_context_item(context)
+        finally:
+            self.context_list.blockSignals(False)
+            self.context_list.setUpdatesEnabled(True)
+    
+    def _add_context_item(self, context: Context):
+        """Append a list item for a context."""
+        item = QListWidgetItem(f"{context.name}")
+        item.setData(Qt.UserRole, context.id)
+        item.setToolTip(context.description)
+        self.context_list.addItem(item)
     
     def _on_context_selected(self):
         """Handle context selection."""
@@ -208,15 +250,15 @@ class ContextManager(QWidget):
     
     def _get_context_by_id(self, context_id: str) -> Optional[Context]:
         """Get context by ID."""
-        for context in self.contexts:
-            if context.id == context_id:
-                return context
-        return None
+        return self._contexts_by_id.get(context_id)
     
     def _add_context(self):
         """Add a new context."""
         # Generate unique ID
-        context_id = f"ctx_{len(self.contexts)}"
+        index = len(self.contexts)
+        while f"ctx_{index}" in self._contexts_by_id:
+            index += 1
+        context_id = f"ctx_{index}"
         
         new_context = Context(
             id=context_id,
@@ -225,7 +267,8 @@ class ContextManager(QWidget):
         )
         
         self.contexts.append(new_context)
-        self._refresh_context_list()
+        self._contexts_by_id[context_id] = new_context
+        self._add_context_item(new_context)
         self.contexts_changed.emit()
     
     def _edit_context(self):
@@ -257,7 +300,8 @@ class ContextManager(QWidget):
             
             if reply == QMessageBox.Yes:
                 self.contexts.remove(context)
-                self._refresh_context_list()
+                del self._contexts_by_id[context.id]
+                self.context_list.takeItem(self.context_list.row(current_item))
                 self.contexts_changed.emit()
     
     def _save_context_changes(self):
@@ -273,7 +317,9 @@ class ContextManager(QWidget):
             context.name = self.context_name_edit.toPlainText().strip()
             context.description = self.context_desc_edit.toPlainText().strip()
             
-            self._refresh_context_list()
+            # Only this item changed; update it in place
+            current_item.setText(context.name)
+            current_item.setToolTip(context.description)
             self.contexts_changed.emit()
     
     def get_contexts(self) -> List[Context]:
@@ -281,118 +327,196 @@ class ContextManager(QWidget):
         return self.contexts
 
 
-class UCAMatrix(QTableWidget):
-    """Interactive matrix for UCA analysis."""
+class UCAMatrixModel(QAbstractTableModel):
+    """Table model holding the UCA matrix cells."""
     
     uca_created = Signal(UnsafeControlAction)
     uca_updated = Signal(UnsafeControlAction)
+    uca_removed = Signal(UnsafeControlAction)
+    
+    # Cell colors, shared by every data() call
+    _COLOR_UCA = QColor(255, 200, 200)  # Light red
+    _COLOR_SAFE = QColor(200, 255, 200)  # Light green
+    _COLOR_UNKNOWN = QColor(255, 255, 200)  # Light yellow
+    _COLOR_EMPTY = QColor(255, 255, 255)  # White
+    
+    # Custom role returning (text, background, tooltip) in one call
+    CELL_ROLES = Qt.UserRole + 1
     
     def __init__(self, parent=None):
         super().__init__(parent)
         self.control_actions: List[ControlAction] = []
         self.contexts: List[Context] = []
-        self.ucas: Dict[str, UnsafeControlAction] = {}
-        self._setup_ui()
-    
-    def _setup_ui(self):
-        """Setup the matrix UI."""
-        # Enable sorting and selection
-        self.setSortingEnabled(False)
-        self.setSelectionBehavior(QTableWidget.SelectItems)
-        self.setSelectionMode(QTableWidget.SingleSelection)
-        
-        # Setup headers
-        self.horizontalHeader().setStretchLastSection(True)
-        self.verticalHeader().setDefaultSectionSize(80)
-        
-        # Connect signals
-        self.itemChanged.connect(self._on_item_changed)
-        self.itemDoubleClicked.connect(self._on_item_double_clicked)
-    
-    def setup_matrix(self, control_actions: List[ControlAction], contexts: List[Context]):
-        """Setup the matrix with control actions and contexts."""
-        self.control_actions = control_actions
-        self.contexts = contexts
-        
-        # Calculate matrix dimensions
+        self.ucas: Dict[Tuple[str, str, UCACategory], UnsafeControlAction] = {}
+        self._uca_counter = 0
+        # Cells marked safe or with unrecognized text; UCA cells live in
+        # self.ucas and all other cells are empty, so nothing is per cell
+        self._marks: Dict[Tuple[str, str, UCACategory], str] = {}
+        # Row header labels, formatted the first time each row is shown
+        self._row_labels: Dict[int, str] = {}
+    
+    def clear(self):
+        """Drop the layout and every mark, e.g. when another model is loaded."""
+        self.beginResetModel()
+        self.control_actions = []
+        self.contexts = []
+        self.ucas.clear()
+        self._marks.clear()
+        self._row_labels.clear()
+        self._uca_counter = 0
+        self.endResetModel()
+    
+    def set_layout(self, control_actions: List[ControlAction], contexts: List[Context]):
+        """Reset the matrix layout, keeping marks whose row and column survive."""
+        # Marks are keyed by ids, not positions, so only vanished ones go
+        ca_ids = {ca.id for ca in control_actions}
+        ctx_ids = {ctx.id for ctx in contexts}
+        
+        self.beginResetModel()
+        # Copy so in-place edits by the context manager can't skew the layout
+        self.control_actions = list(control_actions)
+        self.contexts = list(contexts)
+        self._row_labels.clear()
+        self._marks = {
+            key: text for key, text in self._marks.items()
+            if key[0] in ca_ids and key[1] in ctx_ids
+        }
+        stale_keys = [key for key in self.ucas if key[0] not in ca_ids or key[1] not in ctx_ids]
+        removed = [self.ucas.pop(key) for key in stale_keys]
+        self._rebind_ucas()
+        self.endResetModel()
+        
+        for uca in removed:
+            self.uca_removed.emit(uca)
+    
+    def update_labels(self, control_actions: List[ControlAction], contexts: List[Context]):
+        """Swap in renamed control actions and contexts with the same layout."""
+        self.control_actions = list(control_actions)
+        self.contexts = list(contexts)
+        self._row_labels.clear()
+        self._rebind_ucas()
+        
+        if contexts:
+            self.headerDataChanged.emit(Qt.Horizontal, 0, len(contexts) - 1)
+        if control_actions:
+            self.headerDataChanged.emit(Qt.Vertical, 0, self.rowCount() - 1)
+    
+    def _rebind_ucas(self):
+        """Point UCAs at the current control action and context objects."""
+        ca_by_id = {ca.id: ca for ca in self.control_actions}
+        ctx_by_id = {ctx.id: ctx for ctx in self.contexts}
+        for (ca_id, ctx_id, _), uca in self.ucas.items():
+            uca.control_action = ca_by_id[ca_id]
+            uca.context = ctx_by_id[ctx_id]
+    
+    def rowCount(self, parent=QModelIndex()):
         # Rows: Control Actions × UCA Categories
+        if parent.isValid():
+            return 0
+        return len(self.control_actions) * _N_CATEGORIES
+    
+    def columnCount(self, parent=QModelIndex()):
         # Columns: Contexts
-        num_rows = len(control_actions) * len(UCACategory)
-        num_cols = len(contexts)
-        
-        self.setRowCount(num_rows)
-        self.setColumnCount(num_cols)
-        
-        # Set column headers (contexts)
-        context_headers = [ctx.name for ctx in contexts]
-        self.setHorizontalHeaderLabels(context_headers)
-        
-        # Set row headers (control action + category combinations)
-        row_headers = []
-        for ca in control_actions:
-            for category in UCACategory:
-                header = f"{ca.name}\n[{category.value}]"
-                row_headers.append(header)
-        
-        self.setVerticalHeaderLabels(row_headers)
-        
-        # Initialize matrix cells
-        self._initialize_cells()
-    
-    def _initialize_cells(self):
-        """Initialize matrix cells with default states."""
-        for row in range(self.rowCount()):
-            for col in range(self.columnCount()):
-                # Create cell item
-                item = QTableWidgetItem("")
-                item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsEditable)
-                
-                # Set background color (white = not analyzed, other colors for UCA states)
-                item.setBackground(QColor(255, 255, 255))  # White
-                
-                self.setItem(row, col, item)
+        if parent.isValid():
+            return 0
+        return len(self.contexts)
+    
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsEditable
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        if role == self.CELL_ROLES:
+            return self._cell_data(index.row(), index.column())
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            return self._cell_data(index.row(), index.column())[0]
+        if role == Qt.BackgroundRole:
+            return self._cell_data(index.row(), index.column())[1]
+        if role == Qt.ToolTipRole:
+            return self._cell_data(index.row(), index.column())[2]
+        return None
     
-    def _get_control_action_and_category_for_row(self, row: int) -> tuple[ControlAction, UCACategory]:
-        """Get control action and category for a given row."""
-        categories = list(UCACategory)
-        ca_index = row // len(categories)
-        cat_index = row % len(categories)
+    def _cell_data(self, row: int, col: int) -> Tuple[str, Optional[QColor], Optional[str]]:
+        """Get the text, background and tooltip of a cell."""
+        key = self._cell_key(row, col)
+        text = self._marks.get(key)
+        if text is not None:
+            # Marked safe or unrecognized text
+            color = self._COLOR_SAFE if text == "Safe" else self._COLOR_UNKNOWN
+            return text, color, None
         
-        return self.control_actions[ca_index], categories[cat_index]
+        uca = self.ucas.get(key)
+        if uca is not None:
+            return "UCA", self._COLOR_UCA, f"Rationale: {uca.rationale}"
+        
+        # Not analyzed cells use the view's white base color
+        return "", None, None
     
-    def _on_item_changed(self, item: QTableWidgetItem):
-        """Handle item changes."""
-        row, col = item.row(), item.column()
+    def setData(self, index, value, role=Qt.EditRole):
+        if role != Qt.EditRole or not index.isValid():
+            return False
+        
+        row, col = index.row(), index.column()
         control_action, category = self._get_control_action_and_category_for_row(row)
         context = self.contexts[col]
         
         # Interpret cell content
-        cell_text = item.text().strip().upper()
+        text = "" if value is None else str(value)
+        state = _CELL_STATE.get(text.strip().upper())
+        
+        key = (control_action.id, context.id, category)
         
-        if cell_text in ['Y', 'YES', 'UCA', '1']:
+        if state is True:
             # Mark as UCA
+            self._marks.pop(key, None)
             self._create_or_update_uca(control_action, context, category, True)
-            item.setBackground(QColor(255, 200, 200))  # Light red
-            item.setText("UCA")
-        elif cell_text in ['N', 'NO', 'SAFE', '0', '']:
+        elif state is False:
             # Mark as safe
+            self._marks[key] = "Safe"
             self._create_or_update_uca(control_action, context, category, False)
-            item.setBackground(QColor(200, 255, 200))  # Light green
-            item.setText("Safe")
         else:
             # Unknown state
-            item.setBackground(QColor(255, 255, 200))  # Light yellow
+            self._marks[key] = text
+        
+        self.dataChanged.emit(index, index)
+        return True
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            # Column headers (contexts)
+            if 0 <= section < len(self.contexts):
+                return self.contexts[section].name
+            return None
+        # Row headers (control action + category combinations)
+        label = self._row_labels.get(section)
+        if label is None and 0 <= section < self.rowCount():
+            ca_index, cat_index = divmod(section, _N_CATEGORIES)
+            label = f"{self.control_actions[ca_index].name}\n[{_CATEGORY_LABELS[cat_index]}]"
+            self._row_labels[section] = label
+        return label
+    
+    def _get_control_action_and_category_for_row(self, row: int) -> tuple[ControlAction, UCACategory]:
+        """Get control action and category for a given row."""
+        ca_index, cat_index = divmod(row, _N_CATEGORIES)
+        return self.control_actions[ca_index], _UCA_CATEGORIES[cat_index]
     
     def _create_or_update_uca(self, control_action: ControlAction, context: Context, 
                              category: UCACategory, is_unsafe: bool):
         """Create or update a UCA entry."""
-        uca_key = f"{control_action.id}_{context.id}_{category.value}"
+        uca_key = (control_action.id, context.id, category)
         
         if is_unsafe:
             if uca_key not in self.ucas:
-                # Create new UCA
+                # Create new UCA; the counter keeps ids unique after removals
+                self._uca_counter += 1
                 uca = UnsafeControlAction(
-                    id=f"UCA-{len(self.ucas)+1}",
+                    id=f"UCA-{self._uca_counter}",
                     control_action=control_action,
                     context=context,
                     category=category,
@@ -406,19 +530,93 @@ class UCAMatrix(QTableWidget):
         else:
             # Remove UCA if it exists
             if uca_key in self.ucas:
-                del self.ucas[uca_key]
+                self.uca_removed.emit(self.ucas.pop(uca_key))
     
-    def _on_item_double_clicked(self, item: QTableWidgetItem):
-        """Handle double-click for detailed editing."""
-        row, col = item.row(), item.column()
+    def _cell_key(self, row: int, col: int) -> Tuple[str, str, UCACategory]:
+        """Get the (control action id, context id, category) key of a cell."""
         control_action, category = self._get_control_action_and_category_for_row(row)
-        context = self.contexts[col]
+        return control_action.id, self.contexts[col].id, category
+    
+    def get_uca_at(self, row: int, col: int) -> Optional[UnsafeControlAction]:
+        """Get the UCA marked in a cell, if any."""
+        return self.ucas.get(self._cell_key(row, col))
+
+
+class UCACellDelegate(QStyledItemDelegate):
+    """Paints matrix cells with text and background from the combined cell role."""
+    
+    def initStyleOption(self, option, index):
+        super().initStyleOption(option, index)
+        # Text and background come from the combined role, one cell lookup
+        text, background, _ = index.data(UCAMatrixModel.CELL_ROLES)
+        option.text = text
+        option.backgroundBrush = QBrush(background) if background is not None else QBrush()
+
+
+class UCAMatrix(QTableView):
+    """Interactive matrix for UCA analysis."""
+    
+    uca_created = Signal(UnsafeControlAction)
+    uca_updated = Signal(UnsafeControlAction)
+    uca_removed = Signal(UnsafeControlAction)
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._layout_key: Optional[tuple] = None
+        self.matrix_model = UCAMatrixModel(self)
+        self.matrix_model.uca_created.connect(self.uca_created)
+        self.matrix_model.uca_updated.connect(self.uca_updated)
+        self.matrix_model.uca_removed.connect(self.uca_removed)
+        self.setModel(self.matrix_model)
+        self.setItemDelegate(UCACellDelegate(self))
+        self._setup_ui()
+    
+    def _setup_ui(self):
+        """Setup the matrix UI."""
+        # Enable sorting and selection
+        self.setSortingEnabled(False)
+        self.setSelectionBehavior(QTableView.SelectItems)
+        self.setSelectionMode(QTableView.SingleSelection)
+        
+        # Setup headers
+        self.horizontalHeader().setStretchLastSection(True)
+        self.verticalHeader().setDefaultSectionSize(80)
         
+        # White background for cells not analyzed yet
+        palette = self.palette()
+        palette.setColor(QPalette.Base, UCAMatrixModel._COLOR_EMPTY)
+        self.setPalette(palette)
+        
+        # Connect signals
+        self.doubleClicked.connect(self._on_cell_double_clicked)
+    
+    def setup_matrix(self, control_actions: List[ControlAction], contexts: List[Context]):
+        """Setup the matrix with control actions and contexts."""
+        layout_key = (tuple(ca.id for ca in control_actions), tuple(ctx.id for ctx in contexts))
+        if layout_key == self._layout_key:
+            # Same rows and columns; only names may have changed
+            self.matrix_model.update_labels(control_actions, contexts)
+            return
+        self._layout_key = layout_key
+        
+        # Cells and headers are served by the model on demand
+        self.setUpdatesEnabled(False)
+        try:
+            self.matrix_model.set_layout(control_actions, contexts)
+        finally:
+            self.setUpdatesEnabled(True)
+    
+    def reset_matrix(self):
+        """Clear the matrix so the next setup starts from scratch."""
+        self._layout_key = None
+        self.matrix_model.clear()
+    
+    def _on_cell_double_clicked(self, index: QModelIndex):
+        """Handle double-click for detailed editing."""
         # Open detailed UCA editor (simplified for now)
-        uca_key = f"{control_action.id}_{context.id}_{category.value}"
+        uca = self.matrix_model.get_uca_at(index.row(), index.column())
         
-        if uca_key in self.ucas:
-            uca = self.ucas[uca_key]
+        if uca is not None:
             # TODO: Open detailed UCA editor dialog
             QMessageBox.information(
                 self, "UCA Details",
@@ -427,20 +625,84 @@ class UCAMatrix(QTableWidget):
     
     def get_ucas(self) -> List[UnsafeControlAction]:
         """Get all identified UCAs."""
-        return list(self.ucas.values())
+        return list(self.matrix_model.ucas.values())
+
+
+class UCAResultsModel(QAbstractListModel):
+    """List model for the identified UCAs."""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._ucas: List[UnsafeControlAction] = []
+        self._uca_row: Dict[str, int] = {}
+    
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._ucas)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        uca = self._ucas[index.row()]
+        
+        if role == Qt.DisplayRole:
+            return f"{uca.id}: {uca.control_action.name} [{uca.category.value}] in {uca.context.name}"
+        if role == Qt.ToolTipRole:
+            return f"Rationale: {uca.rationale}"
+        if role == Qt.UserRole:
+            return uca.id
+        return None
+    
+    def set_ucas(self, ucas: List[UnsafeControlAction]):
+        """Replace all listed UCAs."""
+        self.beginResetModel()
+        self._ucas = list(ucas)
+        self._uca_row = {uca.id: row for row, uca in enumerate(self._ucas)}
+        self.endResetModel()
+    
+    def add_uca(self, uca: UnsafeControlAction):
+        """Append a single UCA."""
+        row = len(self._ucas)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._ucas.append(uca)
+        self._uca_row[uca.id] = row
+        self.endInsertRows()
+    
+    def update_uca(self, uca: UnsafeControlAction):
+        """Repaint the row showing a UCA."""
+        row = self._uca_row.get(uca.id)
+        if row is not None:
+            index = self.index(row)
+            self.dataChanged.emit(index, index)
+    
+    def remove_uca(self, uca: UnsafeControlAction):
+        """Remove the row showing a UCA."""
+        row = self._uca_row.pop(uca.id, None)
+        if row is not None:
+            self.beginRemoveRows(QModelIndex(), row, row)
+            del self._ucas[row]
+            # Rows after the removed one shift up
+            for later in self._ucas[row:]:
+                self._uca_row[later.id] -= 1
+            self.endRemoveRows()
 
 
 class UCAAnalysisTab(QWidget):
     """Main UCA Analysis tab widget."""
     
-    # Signals
-    model_changed = Signal()
+    MATRIX_REFRESH_DELAY_MS = 50
     
     def __init__(self, model: STPAModel, parent=None):
         super().__init__(parent)
         self.model = model
         self.control_actions: List[ControlAction] = []
         self.ucas: List[UnsafeControlAction] = []
+        # Coalesce bursts of context edits into one matrix refresh
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(self.MATRIX_REFRESH_DELAY_MS)
+        self._refresh_timer.timeout.connect(self._refresh_matrix)
         self._setup_ui()
         self._refresh_data()
     
@@ -472,8 +734,8 @@ class UCAAnalysisTab(QWidget):
         
         # Context manager
         self.context_manager = ContextManager()
-        self.context_manager.contexts_changed.connect(self._refresh_matrix)
-        self.context_manager.contexts_changed.connect(self.model_changed.emit)
+        self.context_manager.contexts_changed.connect(self._refresh_timer.start)
+        self.context_manager.contexts_changed.connect(lambda: self.model.notify_changed("uca"))
         left_layout.addWidget(self.context_manager)
         
         # Control actions list
@@ -513,6 +775,7 @@ class UCAAnalysisTab(QWidget):
         self.uca_matrix = UCAMatrix()
         self.uca_matrix.uca_created.connect(self._on_uca_created)
         self.uca_matrix.uca_updated.connect(self._on_uca_updated)
+        self.uca_matrix.uca_removed.connect(self._on_uca_removed)
         scroll_area.setWidget(self.uca_matrix)
         scroll_area.setWidgetResizable(True)
         matrix_layout.addWidget(scroll_area)
@@ -523,7 +786,10 @@ class UCAAnalysisTab(QWidget):
         results_group = QGroupBox("Identified UCAs")
         results_layout = QVBoxLayout(results_group)
         
-        self.uca_results = QListWidget()
+        self.uca_results_model = UCAResultsModel(self)
+        self.uca_results = QListView()
+        self.uca_results.setModel(self.uca_results_model)
+        self.uca_results.setUniformItemSizes(True)
         results_layout.addWidget(self.uca_results)
         
         export_btn = QPushButton("Export UCA Report")
@@ -560,32 +826,35 @@ class UCAAnalysisTab(QWidget):
     
     def _refresh_matrix(self):
         """Refresh the UCA matrix."""
+        self._refresh_timer.stop()
         contexts = self.context_manager.get_contexts()
         if self.control_actions and contexts:
             self.uca_matrix.setup_matrix(self.control_actions, contexts)
+            # Control action and context names may have changed
+            self._rebuild_uca_results()
     
     def _on_uca_created(self, uca: UnsafeControlAction):
         """Handle new UCA creation."""
         self.ucas.append(uca)
-        self._refresh_uca_results()
+        self.uca_results_model.add_uca(uca)
+        self.model.notify_changed("uca")
     
     def _on_uca_updated(self, uca: UnsafeControlAction):
         """Handle UCA updates."""
-        self._refresh_uca_results()
-    
-    def _refresh_uca_results(self):
-        """Refresh the UCA results list."""
-        self.uca_results.clear()
-        
+        self.uca_results_model.update_uca(uca)
+        self.model.notify_changed("uca")
+    
+    def _on_uca_removed(self, uca: UnsafeControlAction):
+        """Handle a UCA being cleared from the matrix."""
+        if uca in self.ucas:
+            self.ucas.remove(uca)
+        self.uca_results_model.remove_uca(uca)
+        self.model.notify_changed("uca")
+    
+    def _rebuild_uca_results(self):
+        """Rebuild the whole UCA results list."""
         # Get all UCAs from matrix
-        all_ucas = self.uca_matrix.get_ucas()
-        
-        for uca in all_ucas:
-            item_text = f"{uca.id}: {uca.control_action.name} [{uca.category.value}] in {uca.context.name}"
-            item = QListWidgetItem(item_text)
-            item.setData(Qt.UserRole, uca.id)
-            item.setToolTip(f"Rationale: {uca.rationale}")
-            self.uca_results.addItem(item)
+        self.uca_results_model.set_ucas(self.uca_matrix.get_ucas())
     
     def _export_uca_report(self):
         """Export UCA analysis report."""
@@ -596,18 +865,21 @@ class UCAAnalysisTab(QWidget):
             QMessageBox.information(self, "No UCAs", "No unsafe control actions identified yet.")
             return
         
-        report = "STPA UCA Analysis Report\n"
-        report += "=" * 50 + "\n\n"
+        parts = ["STPA UCA Analysis Report\n" + "=" * 50 + "\n\n"]
+        separator = "-" * 30
         
         for uca in all_ucas:
-            report += f"ID: {uca.id}\n"
-            report += f"Control Action: {uca.control_action.name}\n"
-            report += f"Category: {uca.category.value}\n"
-            report += f"Context: {uca.context.name}\n"
-            report += f"Rationale: {uca.rationale}\n"
-            report += f"Risk Score: {uca.risk_score}\n"
-            report += "-" * 30 + "\n"
+            parts.append(
+                f"ID: {uca.id}\n"
+                f"Control Action: {uca.control_action.name}\n"
+                f"Category: {uca.category.value}\n"
+                f"Context: {uca.context.name}\n"
+                f"Rationale: {uca.rationale}\n"
+                f"Risk Score: {uca.risk_score}\n"
+                f"{separator}\n"
+            )
         
+        report = "".join(parts)
         QMessageBox.information(self, "UCA Report", f"Report generated:\n\n{report[:500]}...")
     
     def get_model_data(self) -> Dict:
@@ -640,12 +912,21 @@ class UCAAnalysisTab(QWidget):
     def set_model(self, model: STPAModel):
         """Set a new model and refresh the view"""
         self.model = model
+        self.chat_panel.set_model(model)
+        
+        # Marks are keyed by ids that every model shares, so they must not
+        # carry over from the previous model
+        self._refresh_timer.stop()
+        self.uca_matrix.reset_matrix()
+        self.ucas = []
+        self.uca_results_model.set_ucas([])
         self._refresh_data()
     
     def sync_to_model(self):
         """Sync current state to model"""
-        # Import the model classes we need
-        from core.models import UnsafeControlAction as ModelUCA, UCAContext as ModelUCAContext
+        # Apply any pending context edits to the matrix first
+        if self._refresh_timer.isActive():
+            self._refresh_matrix()
         
         # Update model with current UCAs and contexts
         # This method ensures all UCA data is saved to the model
@@ -653,9 +934,8 @@ class UCAAnalysisTab(QWidget):
         all_contexts = self.context_manager.get_contexts()
         
         # Convert UCAs to model format
-        self.model.unsafe_control_actions = []
-        for uca in all_ucas:
-            model_uca = ModelUCA(
+        self.model.unsafe_control_actions = [
+            ModelUCA(
                 id=uca.id,
                 control_action=uca.control_action.name,
                 context=uca.context.name,
@@ -665,22 +945,23 @@ class UCAAnalysisTab(QWidget):
                 severity=uca.severity,
                 likelihood=uca.likelihood
             )
-            self.model.unsafe_control_actions.append(model_uca)
+            for uca in all_ucas
+        ]
         
-        # Convert contexts to model format  
-        self.model.uca_contexts = []
-        for ctx in all_contexts:
-            model_ctx = ModelUCAContext(
+        # Convert contexts to model format
+        self.model.uca_contexts = [
+            ModelUCAContext(
                 id=ctx.id,
                 name=ctx.name,
                 description=ctx.description,
                 conditions=ctx.conditions
             )
-            self.model.uca_contexts.append(model_ctx)
+            for ctx in all_contexts
+        ]
         
         # Save chat transcript
         if hasattr(self, 'chat_panel'):
             self.chat_panel._save_chat_transcript()
         
         # Emit signal to notify of model changes
-        self.model_changed.emit()
+        self.model.notify_changed("uca")